@@ -6,9 +6,13 @@ accurate time calculations, and configurable parameters.
 
 import asyncio
 import logging
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any, TypeVar
 
+import orjson
 import requests
 from blockfrost import ApiError
 from pycardano import (
@@ -44,6 +48,8 @@ from .network import NetworkConfig, NetworkType, get_network_type
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 NotFoundErrorCode = 404
 
 
@@ -54,6 +60,7 @@ class ChainQueryConfig:
     # Transaction handling
     max_retries: int = 10
     retry_delay: int = 20  # seconds
+    initial_retry_delay: float = 0.5  # seconds, doubled up to retry_delay
     submission_timeout: int = 120  # seconds
     utxo_refresh_delay: int = 5  # seconds
 
@@ -101,6 +108,19 @@ class ChainQuery:
         self.context = blockfrost_context or kupo_ogmios_context
         self.config = config or ChainQueryConfig()
 
+        # The chain context and its caches are not thread-safe, so blocking
+        # context calls run on worker threads one at a time
+        self._context_lock = threading.Lock()
+
+        # Keep-alive session reused for direct Kupo requests
+        self._http = requests.Session()
+
+        # Native scripts are addressed by their hash, so a lookup never goes stale
+        self._native_script_cache: dict[ScriptHash, NativeScript] = {}
+
+        # Average block interval, derived from the genesis parameters on first use
+        self._expected_block_time: float | None = None
+
         # Initialize network config if not provided
         if not self.config.network_config:
             try:
@@ -143,11 +163,25 @@ class ChainQuery:
     def _invalidate_cache_for_addresses(self, addresses: list[str | Address]) -> None:
         """Invalidate Kupo cache for given addresses."""
         if isinstance(self.context, KupoChainContextExtension):
-            for address in addresses:
-                addr_str = str(address)
-                addr_key = f"address_{addr_str}"
-                if addr_key in self.context._utxo_cache:
-                    del self.context._utxo_cache[addr_key]
+            with self._context_lock:
+                for address in addresses:
+                    addr_str = str(address)
+                    addr_key = f"address_{addr_str}"
+                    if addr_key in self.context._utxo_cache:
+                        del self.context._utxo_cache[addr_key]
+
+    async def _call_context(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking chain context call on a worker thread.
+
+        Calls are serialized with a lock, so the event loop stays free without
+        the context ever being used from two threads at once.
+        """
+
+        def call() -> T:
+            with self._context_lock:
+                return func(*args)
+
+        return await asyncio.to_thread(call)
 
     @property
     def genesis_params(self) -> GenesisParameters:
@@ -156,6 +190,30 @@ class ChainQuery:
             raise ChainContextError("No chain context available")
         return self.context.genesis_param
 
+    @property
+    def confirmation_timeout(self) -> float:
+        """Get the number of seconds to wait for a transaction confirmation."""
+        return float(self.config.max_retries * self.config.retry_delay)
+
+    @property
+    def expected_block_time(self) -> float:
+        """Get the average number of seconds between blocks.
+
+        Derived as slot length over active slot coefficient, the same interval
+        pycardano uses to refetch the chain tip. Falls back to ``retry_delay``
+        when the genesis parameters are unavailable.
+        """
+        if self._expected_block_time is None:
+            try:
+                genesis = self.genesis_params
+                self._expected_block_time = genesis.slot_length / float(
+                    genesis.active_slots_coefficient
+                )
+            except Exception as e:
+                logger.debug("Could not derive block time from genesis: %s", e)
+                return float(self.config.retry_delay)
+        return self._expected_block_time
+
     @property
     def last_block_slot(self) -> int:
         """Get latest block slot number."""
@@ -192,7 +250,9 @@ class ChainQuery:
             else:
                 kupo_script_url = f"{self.context._kupo_url}/scripts/{script_hash}"
                 script = await asyncio.to_thread(
-                    lambda: requests.get(kupo_script_url, timeout=(5, 15)).json()
+                    lambda: orjson.loads(
+                        self._http.get(kupo_script_url, timeout=(5, 15)).content
+                    )
                 )
                 if script["language"] == "plutus:v3":
                     script = PlutusV3Script(bytes.fromhex(script["script"]))
@@ -222,7 +282,7 @@ class ChainQuery:
         try:
             if isinstance(address, str):
                 address = Address.from_primitive(address)
-            return self.context.utxos(str(address))
+            return await self._call_context(self.context.utxos, str(address))
 
         except ApiError as e:
             raise UTxOQueryError(f"Failed to query UTxOs: {e}") from e
@@ -258,6 +318,30 @@ class ChainQuery:
         except Exception as e:
             raise UTxOQueryError(f"Unexpected error querying UTxOs: {e}") from e
 
+    async def get_utxos_by_asset(
+        self, address: str | Address, asset_policy_id: ScriptHash, asset_name: AssetName
+    ) -> list[UTxO]:
+        """Get UTxOs at an address that hold some asset.
+
+        Args:
+            address: Target address
+            asset_policy_id (ScriptHash): Policy ID - asset minting script hash.
+            asset_name (AssetName): asset name.
+
+        Returns:
+            List of UTxOs
+
+        Raises:
+            UTxOQueryError: If UTxO query fails
+        """
+        matching_utxos = []
+        for utxo in await self.get_utxos(address):
+            multi_asset = utxo.output.amount.multi_asset
+            tokens = multi_asset.get(asset_policy_id) if multi_asset else None
+            if tokens and tokens.get(asset_name, 0) > 0:
+                matching_utxos.append(utxo)
+        return matching_utxos
+
     def get_utxo_by_ref_kupo(self, utxo_reference: TransactionInput) -> UTxO | None:
         """Get a UTxO associated with a reference - transaction id and output index number.
 
@@ -433,9 +517,9 @@ class ChainQuery:
 
             # Submit
             if self.blockfrost:
-                self.blockfrost.submit_tx(tx.to_cbor())
+                await self._call_context(self.blockfrost.submit_tx, tx.to_cbor())
             else:
-                self.ogmios.submit_tx(tx.to_cbor())
+                await self._call_context(self.ogmios.submit_tx, tx.to_cbor())
 
             status = "submitted"
 
@@ -465,9 +549,15 @@ class ChainQuery:
     ) -> tuple[str, Transaction | None]:
         """Wait for transaction confirmation with timeout and retries.
 
+        The first checks come quickly and the delay between them doubles up to
+        a third of the expected block time (never more than ``retry_delay``), so
+        a transaction is seen soon after its block without polling faster than
+        blocks can arrive.
+
         Args:
             tx_id: Transaction ID to monitor
-            timeout: Optional custom timeout in seconds
+            timeout: Optional custom timeout in seconds, defaults to the
+                ``max_retries * retry_delay`` budget
 
         Returns:
             Tuple of (status, transaction)
@@ -475,12 +565,50 @@ class ChainQuery:
         Raises:
             TransactionConfirmationError: If confirmation fails
         """
-        timeout = timeout or self.config.submission_timeout
-        retries = 0
+        timeout = timeout or self.confirmation_timeout
         tx_id = str(tx_id)
+        start = time.monotonic()
+        deadline = start + timeout
+        max_delay = min(
+            max(self.expected_block_time / 3, self.config.initial_retry_delay),
+            self.config.retry_delay,
+        )
+        delay = min(self.config.initial_retry_delay, max_delay)
+        attempts = 0
+
+        while True:
+            tx = await self._call_context(self._check_tx_confirmation, tx_id)
+            attempts += 1
+            if tx:
+                logger.info(
+                    "Transaction confirmed: %s (%.1fs, %d checks)",
+                    tx_id,
+                    time.monotonic() - start,
+                    attempts,
+                )
+                return "confirmed", tx
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return "timeout", None
+
+            logger.debug("Waiting %.2fs for confirmation of %s", delay, tx_id)
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+    def _check_tx_confirmation(self, tx_id: str) -> Transaction | None:
+        """Check whether a transaction has been included on chain.
 
-        async def check_blockfrost(tx_id: TransactionId) -> Transaction | None:
-            """Check transaction status using Blockfrost."""
+        Args:
+            tx_id: Transaction ID to check
+
+        Returns:
+            Transaction data if confirmed, None otherwise
+
+        Raises:
+            TransactionConfirmationError: If the status query fails
+        """
+        if isinstance(self.context, BlockFrostChainContext):
             try:
                 return self.blockfrost.api.transaction(tx_id)
             except ApiError as e:
@@ -492,43 +620,14 @@ class ChainQuery:
                     ) from e
                 return None
 
-        async def check_ogmios(tx_id: TransactionId) -> Transaction | None:
-            """Check transaction status using Ogmios."""
-            try:
-                # Use UTxO query as a proxy for transaction confirmation
-                response = self.context._wrapped_backend._query_utxos_by_tx_id(tx_id, 0)
-                return response if response != [] else None
-            except Exception as e:
-                raise TransactionConfirmationError(
-                    f"Error checking transaction: {e}"
-                ) from e
-
-        # Select appropriate check function
-        check_fn = (
-            check_blockfrost
-            if isinstance(self.context, BlockFrostChainContext)
-            else check_ogmios
-        )
-
-        while retries < self.config.max_retries:
-            try:
-                tx = await check_fn(tx_id)
-                if tx:
-                    logger.info("Transaction confirmed: %s", tx_id)
-                    return "confirmed", tx
-
-            except TransactionConfirmationError:
-                raise
-
-            await asyncio.sleep(self.config.retry_delay)
-            retries += 1
-            logger.info(
-                "Waiting for confirmation (attempt %d/%d)",
-                retries,
-                self.config.max_retries,
-            )
-
-        return "timeout", None
+        try:
+            # Use UTxO query as a proxy for transaction confirmation
+            response = self.context._wrapped_backend._query_utxos_by_tx_id(tx_id, 0)
+            return response if response != [] else None
+        except Exception as e:
+            raise TransactionConfirmationError(
+                f"Error checking transaction: {e}"
+            ) from e
 
     async def submit_tx_builder(
         self,
@@ -589,13 +688,19 @@ class ChainQuery:
 
     async def get_native_script(self, script_hash: ScriptHash) -> NativeScript | None:
         """Get native script by hash."""
+        cached = self._native_script_cache.get(script_hash)
+        if cached is not None:
+            return cached
+
         try:
             if isinstance(self.context, BlockFrostChainContext):
                 script = self.context._get_script(str(script_hash))
             else:
                 kupo_script_url = f"{self.context._kupo_url}/scripts/{script_hash}"
                 script_json = await asyncio.to_thread(
-                    lambda: requests.get(kupo_script_url, timeout=(5, 15)).json()
+                    lambda: orjson.loads(
+                        self._http.get(kupo_script_url, timeout=(5, 15)).content
+                    )
                 )
                 if not isinstance(script_json, dict):
                     raise ScriptQueryError(
@@ -605,6 +710,7 @@ class ChainQuery:
             if not script:
                 raise ScriptQueryError(f"Script not found for hash: {script_hash}")
 
+            self._native_script_cache[script_hash] = script
             return script
 
         except Exception as e:
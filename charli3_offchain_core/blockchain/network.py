@@ -13,6 +13,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Final, TypeAlias
 
+import orjson
 import requests
 
 from .exceptions import NetworkConfigError, NetworkTimeError, ValidationError
@@ -172,7 +173,7 @@ def get_devnet_config() -> NetworkConfig | None:
         )
         response.raise_for_status()  # Raise exception for non-200 status codes
 
-        shelley_params = response.json()
+        shelley_params = orjson.loads(response.content)
 
         # Convert the systemStart to a timestamp in milliseconds
         system_start = shelley_params.get("systemStart")
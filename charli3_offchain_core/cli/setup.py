@@ -2,6 +2,7 @@ import json
 import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, NamedTuple
 
@@ -103,6 +104,7 @@ def setup_platform_from_config(config: Path, metadata: Path | None) -> tuple[
 
 def setup_oracle_from_config(
     config: Path,
+    chain_query: ChainQuery | None = None,
 ) -> tuple[
     DeploymentConfig,
     OracleConfiguration,
@@ -115,7 +117,11 @@ def setup_oracle_from_config(
     PlatformAuthFinder,
     dict,
 ]:
-    """Set up all required modules for oracle deployment from config file."""
+    """Set up all required modules for oracle deployment from config file.
+
+    An existing chain query may be passed in to reuse its backend connection
+    instead of creating a new one from the network configuration.
+    """
     # Load and validate configuration
     deployment_config = DeploymentConfig.from_yaml(config)
     validate_deployment_config(deployment_config)
@@ -144,9 +150,7 @@ def setup_oracle_from_config(
             oracle_config, deployment_config.blueprint_path
         )
     else:
-        base_contracts = OracleContracts.from_blueprint(
-            deployment_config.blueprint_path
-        )
+        base_contracts = load_base_contracts(deployment_config.blueprint_path)
         parameterized_contracts = OracleContracts(
             spend=base_contracts.apply_spend_params(oracle_config),
             mint=base_contracts.mint,
@@ -166,7 +170,8 @@ def setup_oracle_from_config(
         platform_address=platform_address,
     )
 
-    chain_query = create_chain_query(deployment_config.network)
+    if chain_query is None:
+        chain_query = create_chain_query(deployment_config.network)
 
     tx_manager = TransactionManager(chain_query)
 
@@ -216,7 +221,9 @@ def setup_oracle_from_config(
     )
 
 
-def setup_management_from_config(config: Path) -> tuple[
+def setup_management_from_config(
+    config: Path, chain_query: ChainQuery | None = None
+) -> tuple[
     ManagementConfig,
     OracleConfiguration,
     LoadedKeys,
@@ -226,7 +233,7 @@ def setup_management_from_config(config: Path) -> tuple[
     PlatformAuthFinder,
 ]:
     management_config = ManagementConfig.from_yaml(config)
-    base_contracts = OracleContracts.from_blueprint(management_config.blueprint_path)
+    base_contracts = load_base_contracts(management_config.blueprint_path)
 
     reward_token = setup_token(
         management_config.tokens.reward_token_policy,
@@ -253,7 +260,8 @@ def setup_management_from_config(config: Path) -> tuple[
         platform_address=platform_address,
     )
 
-    chain_query = create_chain_query(management_config.network)
+    if chain_query is None:
+        chain_query = create_chain_query(management_config.network)
     tx_manager = TransactionManager(chain_query)
     platform_auth_finder = PlatformAuthFinder(chain_query)
 
@@ -268,6 +276,31 @@ def setup_management_from_config(config: Path) -> tuple[
     )
 
 
+@lru_cache(maxsize=8)
+def _load_blueprint_contracts(blueprint_path: str, mtime_ns: int) -> OracleContracts:
+    """Parse a blueprint once per path and modification time."""
+    return OracleContracts.from_blueprint(blueprint_path)
+
+
+def load_base_contracts(blueprint_path: Path | str) -> OracleContracts:
+    """Load the unparameterized oracle contracts from a blueprint.
+
+    The parsed contracts are reused while the blueprint file is unchanged.
+    They are never mutated, since applying parameters builds new contracts.
+
+    Args:
+        blueprint_path: Path to the Aiken blueprint
+
+    Returns:
+        Oracle contracts loaded from the blueprint
+    """
+    path = Path(blueprint_path)
+    if not path.is_file():
+        # Let the loader report the missing blueprint
+        return OracleContracts.from_blueprint(path)
+    return _load_blueprint_contracts(str(path.resolve()), path.stat().st_mtime_ns)
+
+
 def setup_token(
     token_policy: str | None, token_name: str | None
 ) -> NoDatum | SomeAsset:
@@ -75,7 +75,7 @@ class ReferenceScriptFinder:
                     raise ValidationError(
                         f"No utxos with script by reference {self.ref_script_config.utxo_reference}"
                     )
-                if await self._validate_script(utxo.output.script, script_hash):
+                if self._validate_script(utxo.output.script, script_hash):
                     return utxo
                 raise ValidationError(
                     f"Not matching script hash {script_hash} for utxo reference {self.ref_script_config.utxo_reference}"
@@ -83,23 +83,24 @@ class ReferenceScriptFinder:
 
             # Get UTxOs at script address
             utxos = await self.chain_query.get_utxos(self.reference_script_address)
-            reference_utxos = [utxo for utxo in utxos if utxo.output.script]
-
-            if not reference_utxos:
-                return None
-
-            for utxo in reference_utxos:
-                if await self._validate_script(utxo.output.script, script_hash):
-                    logger.info("Found matching manager reference script")
-                    return utxo
-
-            return None
+            match = next(
+                (
+                    utxo
+                    for utxo in utxos
+                    if utxo.output.script
+                    and self._validate_script(utxo.output.script, script_hash)
+                ),
+                None,
+            )
+            if match is not None:
+                logger.info("Found matching manager reference script")
+            return match
 
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Error finding manager reference script: %s", e)
             return None
 
-    async def _validate_script(
+    def _validate_script(
         self,
         script: PlutusV3Script,
         target_hash: bytes,
@@ -79,16 +79,14 @@ def filter_utxos_by_token_name(
         token_name.encode() if isinstance(token_name, str) else token_name
     )
 
-    return [
-        utxo
-        for utxo in utxos
-        if (
-            utxo.output.amount.multi_asset  # Has multi_asset
-            and policy_id in utxo.output.amount.multi_asset  # Has correct policy
-            and encoded_name in utxo.output.amount.multi_asset[policy_id]  # Has token
-            and utxo.output.amount.multi_asset[policy_id][encoded_name] >= 1
-        )  # Amount is >= 1
-    ]
+    matching_utxos = []
+    for utxo in utxos:
+        multi_asset = utxo.output.amount.multi_asset
+        # Look the policy up once, then check the token amount is >= 1
+        tokens = multi_asset.get(policy_id) if multi_asset else None
+        if tokens and tokens.get(encoded_name, 0) >= 1:
+            matching_utxos.append(utxo)
+    return matching_utxos
 
 
 def has_required_tokens(utxo: UTxO, policy_id: bytes, token_names: list[str]) -> bool:
@@ -3,7 +3,7 @@
 import logging
 from collections.abc import Sequence
 
-from pycardano import ScriptHash, UTxO
+from pycardano import AssetName, ScriptHash, UTxO
 
 from charli3_offchain_core.models.oracle_datums import (
     AggState,
@@ -230,6 +230,60 @@ def get_reward_account_by_policy_id(
         raise StateValidationError(f"Failed to get reward account: {e}") from e
 
 
+def scan_script_utxos(
+    utxos: Sequence[UTxO],
+    policy_id: ScriptHash,
+    settings_token_name: str,
+    token_name: str | None = None,
+) -> tuple[OracleSettingsDatum | None, UTxO | None, list[UTxO]]:
+    """Find oracle settings and token UTxOs in a single pass.
+
+    Args:
+        utxos: List of UTxOs to search
+        policy_id: Policy ID of the oracle tokens
+        settings_token_name: Name of the oracle settings token
+        token_name: Name of the token to collect matching UTxOs for, if any
+
+    Returns:
+        OracleSettingsDatum: Oracle settings datum, or None if not found
+        UTxO: Oracle settings UTxO, or None if not found
+        list[UTxO]: UTxOs containing the requested token, empty without
+            a token name
+
+    Raises:
+        StateValidationError: If the oracle settings datum cannot be decoded
+    """
+    settings_name = AssetName(settings_token_name.encode())
+    encoded_name = AssetName(token_name.encode()) if token_name else None
+
+    settings_utxo = None
+    matching_utxos: list[UTxO] = []
+    for utxo in utxos:
+        multi_asset = utxo.output.amount.multi_asset
+        tokens = multi_asset.get(policy_id) if multi_asset else None
+        if not tokens:
+            continue
+        if settings_utxo is None and tokens.get(settings_name, 0) >= 1:
+            settings_utxo = utxo
+        if encoded_name is not None and tokens.get(encoded_name, 0) >= 1:
+            matching_utxos.append(utxo)
+
+    if settings_utxo is None:
+        return None, None, matching_utxos
+
+    try:
+        if settings_utxo.output.datum and not isinstance(
+            settings_utxo.output.datum, OracleSettingsVariant
+        ):
+            settings_utxo.output.datum = OracleSettingsVariant.from_cbor(
+                settings_utxo.output.datum.cbor
+            )
+        return settings_utxo.output.datum.datum, settings_utxo, matching_utxos
+
+    except Exception as e:
+        raise StateValidationError(f"Failed to get oracle settings: {e}") from e
+
+
 def filter_valid_agg_states(utxos: Sequence[UTxO], current_time: int) -> list[UTxO]:
     """Filter UTxOs for empty or expired aggregation states.
 
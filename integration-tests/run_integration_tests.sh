@@ -96,7 +96,8 @@ wait_for_service "http://localhost:1442/health" "Kupo" 60 || exit 1
 # Tests
 run_test() {
   local test_pattern="$1"
-  poetry run pytest tests -v -k "$test_pattern"
+  # Standalone variants marked slow are covered by combined tests
+  poetry run pytest tests -v -k "$test_pattern" -m "not slow"
 
   # Capture the exit code of the test
   test_result=$?
@@ -122,6 +123,9 @@ run_test_multiple_times() {
 
 # Execute tests in order
 
+# 0. Test helpers (no chain access)
+run_test "TestTransientChainErrors"
+
 # 1. Initial Setup & Core Components
 # 1.1. Create Platform Auth NFT
 run_test "TestPlatformAuth"
@@ -158,11 +162,8 @@ run_test "TestAddNodes"
 # 3.3. Test editing settings
 run_test "TestEditSettings"
 
-# 3.4. Test scaling up
-run_test "TestScaleUp"
-
-# 3.5. Test scaling down
-run_test "TestScaleDown"
+# 3.4. Test scaling up and back down (TestScaleUp/TestScaleDown run them separately)
+run_test "TestScaleRoundtrip"
 
 # 3.6. Oracle Pause
 run_test "TestOraclePause"
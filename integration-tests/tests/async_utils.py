@@ -7,21 +7,34 @@ T = TypeVar("T")
 
 
 def async_retry(
-    tries: int = 3, delay: int = 1
+    tries: int = 3,
+    delay: float = 1,
+    backoff: float = 1,
+    max_delay: float | None = None,
+    exceptions: tuple[type[Exception], ...] = (Exception,),
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    """Retry decorator for async functions."""
+    """Retry decorator for async functions.
+
+    The wait between attempts starts at ``delay`` and is multiplied by
+    ``backoff`` after every failure, capped at ``max_delay`` when given.
+    Only ``exceptions`` are retried; anything else propagates immediately.
+    """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception = None
+            wait = delay
             for attempt in range(tries):
                 try:
                     return await func(*args, **kwargs)
-                except Exception as e:
+                except exceptions as e:
                     last_exception = e
                     if attempt < tries - 1:
-                        await asyncio.sleep(delay)
+                        await asyncio.sleep(wait)
+                        wait *= backoff
+                        if max_delay is not None:
+                            wait = min(wait, max_delay)
             raise last_exception
 
         return wrapper
@@ -7,15 +7,24 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any, ClassVar
 
+import requests
+from blockfrost import ApiError
 from pycardano import (
     Network,
+    ScriptHash,
     TransactionBuilder,
+    TransactionFailedException,
     TransactionOutput,
 )
 
+from charli3_offchain_core.blockchain.chain_query import ChainQuery
+from charli3_offchain_core.blockchain.exceptions import TransactionError, UTxOQueryError
 from charli3_offchain_core.cli.config.formatting import format_status_update
 from charli3_offchain_core.cli.config.reference_script import ReferenceScriptConfig
-from charli3_offchain_core.cli.setup import setup_oracle_from_config
+from charli3_offchain_core.cli.setup import (
+    setup_oracle_from_config,
+    setup_platform_from_config,
+)
 
 from .async_utils import async_retry
 from .test_utils import logger, wait_for_indexing
@@ -27,6 +36,18 @@ sys.setrecursionlimit(2000)  # Default is usually 1000
 
 TEST_RETRIES = 3
 
+# Chain errors worth retrying; configuration and validation errors fail fast.
+# Backend and HTTP errors that ChainQuery does not wrap are listed as well.
+TRANSIENT_CHAIN_ERRORS = (
+    TransactionError,
+    UTxOQueryError,
+    TransactionFailedException,
+    ApiError,
+    requests.exceptions.RequestException,
+    ConnectionError,
+    TimeoutError,
+)
+
 
 class TestBase:
     """Base class for ODV system integration tests."""
@@ -34,6 +55,12 @@ class TestBase:
     NETWORK = Network.TESTNET
     DIR_PATH: ClassVar[str] = os.path.dirname(os.path.realpath(__file__))
 
+    # Chain query shared by every test so the backend context is built once
+    _shared_chain_query: ClassVar[ChainQuery | None] = None
+
+    # Platform setups shared by every test, keyed by config path and mtime
+    _platform_setup_cache: ClassVar[dict[tuple[str, float], tuple]] = {}
+
     def setup_method(self, method: Any) -> None:
         """Set up test configuration."""
         logger.info("Setting up test base environment")
@@ -48,7 +75,9 @@ class TestBase:
         try:
             # Use the CLI setup function to load configuration
             logger.info(f"Loading configuration from {self.config_path}")
-            setup_result = setup_oracle_from_config(self.config_path)
+            setup_result = setup_oracle_from_config(
+                self.config_path, chain_query=TestBase._shared_chain_query
+            )
 
             # Unpack the result tuple
             (
@@ -63,6 +92,7 @@ class TestBase:
                 self.platform_auth_finder,
                 self.configs,
             ) = setup_result
+            TestBase._shared_chain_query = self.chain_query
             self.ref_script_config = ReferenceScriptConfig.from_yaml(self.config_path)
 
             # Set status callback once in base class
@@ -86,6 +116,13 @@ class TestBase:
             # For easier access, store some specific configurations
             self.nodes_config = self.deployment_config.nodes
             self.token_config = self.deployment_config.tokens
+
+            # Decode the oracle policy once for every lookup; it is unset
+            # until the oracle has been deployed
+            oracle_policy = self.token_config.oracle_policy
+            self._oracle_script_hash = (
+                ScriptHash(bytes.fromhex(oracle_policy)) if oracle_policy else None
+            )
             self.timing_config = self.deployment_config.timing
             self.fee_config = self.configs["rate_token"]
 
@@ -105,6 +142,24 @@ class TestBase:
             logger.error(f"Error setting up test environment: {e}")
             raise
 
+    def load_platform_setup(self) -> tuple:
+        """Return the platform setup for the config file, building it once.
+
+        The setup is rebuilt when the configuration file changes on disk.
+        """
+        cache_key = (str(self.config_path), self.config_path.stat().st_mtime)
+        platform_setup = TestBase._platform_setup_cache.get(cache_key)
+        if platform_setup is None:
+            platform_setup = setup_platform_from_config(self.config_path, None)
+            TestBase._platform_setup_cache[cache_key] = platform_setup
+        return platform_setup
+
+    def invalidate_platform_setup(self) -> None:
+        """Drop cached platform setups built from this test's configuration file."""
+        config_path = str(self.config_path)
+        for key in [k for k in TestBase._platform_setup_cache if k[0] == config_path]:
+            del TestBase._platform_setup_cache[key]
+
     @async_retry(tries=TEST_RETRIES, delay=3)
     async def assert_output(
         self, target_address: str, predicate_function: Callable
@@ -180,8 +235,13 @@ class TestBase:
                 logger.error(f"Collateral creation failed with status: {status}")
                 return False
 
-            # Wait for indexing
-            await wait_for_indexing()
+            # Wait until the new collateral outputs are indexed
+            await wait_for_indexing(
+                30,
+                chain_query=self.tx_manager.chain_query,
+                address=self.admin_address,
+                tx_id=tx.id,
+            )
 
             # Verify UTxOs were created
             new_utxos = await self.tx_manager.chain_query.get_utxos(self.admin_address)
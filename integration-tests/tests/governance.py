@@ -1,31 +1,46 @@
+import asyncio
 import os
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
-from pycardano import ScriptHash, UTxO
+from pycardano import Address, AssetName, PlutusData, ScriptHash, UTxO
 from pycardano.hash import VerificationKeyHash
 
+from charli3_offchain_core.blockchain.chain_query import ChainQuery
 from charli3_offchain_core.cli.config.formatting import format_status_update
 from charli3_offchain_core.cli.config.nodes import NodesConfig
 from charli3_offchain_core.cli.config.reference_script import ReferenceScriptConfig
 from charli3_offchain_core.cli.governance import setup_management_from_config
+from charli3_offchain_core.constants.status import ProcessStatus
 from charli3_offchain_core.models.oracle_datums import (
     AggState,
     RewardAccountVariant,
 )
 from charli3_offchain_core.oracle.governance.orchestrator import GovernanceOrchestrator
-from charli3_offchain_core.oracle.utils.asset_checks import filter_utxos_by_token_name
-from charli3_offchain_core.oracle.utils.state_checks import (
-    convert_cbor_to_agg_states,
-    convert_cbor_to_reward_accounts,
-)
+from charli3_offchain_core.oracle.utils.common import get_script_utxos
 
-from .test_utils import logger
+from .test_utils import logger, poll_until
 
 # Number of retry attempts for test operations
 MAX_TEST_RETRIES = 3
 
+# Oracle token names identifying AggState and RewardAccount UTxOs
+AGG_STATE_TOKEN = AssetName(b"C3AS")
+REWARD_ACCOUNT_TOKEN = AssetName(b"C3RA")
+
+
+def _decode_datum(utxo: UTxO, datum_type: type[PlutusData]) -> bool:
+    """Decode a UTxO's CBOR datum in place, reporting whether it has one."""
+    datum = utxo.output.datum
+    if not datum:
+        return False
+    if not isinstance(datum, datum_type):
+        if not datum.cbor:
+            return False
+        utxo.output.datum = datum_type.from_cbor(datum.cbor)
+    return True
+
 
 class GovernanceBase:
     """Base class for Oracle Governance integration tests.
@@ -51,6 +66,9 @@ class GovernanceBase:
 
     DIR_PATH: ClassVar[str] = os.path.dirname(os.path.realpath(__file__))
 
+    # Chain query shared by every test so the backend context is built once
+    _shared_chain_query: ClassVar[ChainQuery | None] = None
+
     def setup_method(self, method: Any) -> None:
         """Set up test configuration and environment for each test method.
 
@@ -76,7 +94,9 @@ class GovernanceBase:
         try:
             # Use the CLI setup function to load configuration
             logger.info(f"Loading configuration from {self.config_path}")
-            setup_result = setup_management_from_config(self.config_path)
+            setup_result = setup_management_from_config(
+                self.config_path, chain_query=GovernanceBase._shared_chain_query
+            )
 
             # Unpack the result tuple
             (
@@ -88,8 +108,25 @@ class GovernanceBase:
                 self.tx_manager,
                 self.platform_auth_finder,
             ) = setup_result
+            GovernanceBase._shared_chain_query = self.chain_query
             self.ref_script_config = ReferenceScriptConfig.from_yaml(self.config_path)
 
+            # Decode the oracle policy and script address once for every lookup
+            oracle_policy = self.management_config.tokens.oracle_policy
+            self._oracle_script_hash = (
+                ScriptHash(bytes.fromhex(oracle_policy)) if oracle_policy else None
+            )
+            script_address = self.oracle_addresses.script_address
+            self._script_address = (
+                Address.from_primitive(script_address) if script_address else None
+            )
+            platform_address = self.oracle_addresses.platform_address
+            self._platform_address = (
+                Address.from_primitive(str(platform_address))
+                if platform_address
+                else None
+            )
+
             # Initialize escrow configuration and governance orchestrator
             self.governance_orchestrator = GovernanceOrchestrator(
                 chain_query=self.chain_query,
@@ -151,62 +188,210 @@ class GovernanceBase:
 
         return NodesConfig(required_signatures=required_signatures, nodes=new_nodes)
 
-    def extract_aggregation_state_utxos(
-        self, utxos: Sequence[UTxO], policy_hash: str
-    ) -> list[UTxO]:
-        """Extract UTxOs containing valid AggState tokens and datums.
+    def count_oracle_utxos(
+        self, utxos: Sequence[UTxO], policy_id: ScriptHash
+    ) -> tuple[int, int]:
+        """Count valid AggState and RewardAccount UTxOs in one pass.
 
-        Filters and returns UTxOs that contain AggState tokens with
-        valid AggState datums.
+        Each UTxO's oracle tokens are looked up once; a UTxO is counted when it
+        holds the matching token and a datum of the expected type, decoding
+        CBOR datums in place as the state_checks converters do.
 
         Args:
-            utxos (Sequence[UTxO]): List of UTxOs to filter
-            policy_hash (str): The policy hash to filter tokens by
+            utxos (Sequence[UTxO]): List of UTxOs to count
+            policy_id (ScriptHash): The oracle token policy to filter by
 
         Returns:
-            List[UTxO]: List of UTxOs with valid AggState datums
+            tuple[int, int]: Number of UTxOs with valid AggState datums and
+                number of UTxOs with valid RewardAccountVariant datums
         """
-        # Filter UTxOs containing AggState tokens
-        agg_state_utxos = filter_utxos_by_token_name(
-            utxos, ScriptHash(bytes.fromhex(policy_hash)), "C3AS"
-        )
-
-        # Convert CBOR encoded datums to AggState objects
-        utxos_with_datum = convert_cbor_to_agg_states(agg_state_utxos)
+        agg_state_count = 0
+        reward_account_count = 0
+        for utxo in utxos:
+            multi_asset = utxo.output.amount.multi_asset
+            tokens = multi_asset.get(policy_id) if multi_asset else None
+            if not tokens:
+                continue
+            if tokens.get(AGG_STATE_TOKEN, 0) >= 1 and _decode_datum(utxo, AggState):
+                agg_state_count += 1
+            if tokens.get(REWARD_ACCOUNT_TOKEN, 0) >= 1 and _decode_datum(
+                utxo, RewardAccountVariant
+            ):
+                reward_account_count += 1
+        return agg_state_count, reward_account_count
+
+    async def snapshot_oracle_counts(self) -> tuple[int, int]:
+        """Fetch the script UTxOs once and count the oracle UTxO kinds.
 
-        # Return only UTxOs with valid AggState datums
-        return [
-            utxo
-            for utxo in utxos_with_datum
-            if utxo.output.datum and isinstance(utxo.output.datum, AggState)
-        ]
+        Returns:
+            tuple[int, int]: Number of valid AggState UTxOs and number of valid
+                RewardAccount UTxOs at the script address
+        """
+        utxos = await get_script_utxos(self._script_address, self.tx_manager)
+        return self.count_oracle_utxos(utxos, self._oracle_script_hash)
 
-    def extract_reward_account_utxos(
-        self, utxos: Sequence[UTxO], policy_hash: str
-    ) -> list[UTxO]:
-        """Extract UTxOs containing valid RewardAccount tokens and datums.
+    async def run_scale(
+        self,
+        direction: Literal["up", "down"],
+        reward_account_count: int,
+        aggstate_count: int,
+    ) -> None:
+        """Scale the oracle's RewardAccount and AggState UTxOs and verify the result.
 
-        Filters and returns UTxOs that contain RewardAccount tokens with
-        valid RewardAccountVariant datums.
+        Counts the current UTxOs, builds and submits the scale transaction with the
+        platform auth NFT, then polls until both counts have changed by the
+        requested amounts.
 
         Args:
-            utxos (Sequence[UTxO]): List of UTxOs to filter
-            policy_hash (str): The policy hash to filter tokens by
+            direction (Literal["up", "down"]): Whether to add or remove UTxOs
+            reward_account_count (int): Number of RewardAccount UTxOs to add/remove
+            aggstate_count (int): Number of AggState UTxOs to add/remove
 
-        Returns:
-            List[UTxO]: List of UTxOs with valid RewardAccountVariant datums
+        Raises:
+            AssertionError: If the transaction fails to build or submit, or if the
+                UTxO counts do not change as expected
         """
-        # Filter UTxOs containing RewardAccount tokens
-        reward_account_utxos = filter_utxos_by_token_name(
-            utxos, ScriptHash(bytes.fromhex(policy_hash)), "C3RA"
+        scaling_up = direction == "up"
+        action = "added" if scaling_up else "removed"
+        sign = 1 if scaling_up else -1
+        tokens = self.management_config.tokens
+
+        logger.info(f"Starting Oracle scale-{direction} operation")
+        # Configuration details are only formatted when debug logging is on
+        logger.debug(
+            "Using admin address: %s, platform address: %s, oracle script "
+            "address: %s, platform auth policy ID: %s, oracle policy: %s",
+            self.oracle_addresses.admin_address,
+            self.oracle_addresses.platform_address,
+            self.oracle_addresses.script_address,
+            tokens.platform_auth_policy,
+            tokens.oracle_policy,
+        )
+        logger.info(
+            f"Scale-{direction}: {reward_account_count} RewardAccount(s) + "
+            f"{aggstate_count} AggState(s)"
         )
 
-        # Convert CBOR encoded datums to RewardAccountVariant objects
-        utxos_with_datum = convert_cbor_to_reward_accounts(reward_account_utxos)
+        # BEFORE: Fetch script and platform UTxOs alongside the platform
+        # script, and count initial AggState and RewardAccount UTxOs
+        platform_address = self._platform_address
+        initial_utxos, platform_utxos, platform_script = await asyncio.gather(
+            self.chain_query.get_utxos(self._script_address),
+            self.chain_query.get_utxos(platform_address),
+            self.platform_auth_finder.get_platform_script(platform_address),
+        )
+        assert initial_utxos, "No UTxOs found at script address"
 
-        # Return only UTxOs with valid RewardAccountVariant datums
-        return [
-            utxo
-            for utxo in utxos_with_datum
-            if utxo.output.datum and isinstance(utxo.output.datum, RewardAccountVariant)
-        ]
+        initial_agg_state_count, initial_reward_account_count = self.count_oracle_utxos(
+            initial_utxos, self._oracle_script_hash
+        )
+
+        logger.info(f"Initial AggState UTxOs: {initial_agg_state_count}")
+        logger.info(f"Initial RewardAccount UTxOs: {initial_reward_account_count}")
+
+        if not scaling_up:
+            # Verify that we have enough UTxOs to remove
+            assert initial_agg_state_count >= aggstate_count, (
+                f"Insufficient AggState UTxOs for scale-down: Found "
+                f"{initial_agg_state_count}, but need at least {aggstate_count} to remove"
+            )
+            assert initial_reward_account_count >= reward_account_count, (
+                f"Insufficient RewardAccount UTxOs for scale-down: Found "
+                f"{initial_reward_account_count}, but need at least "
+                f"{reward_account_count} to remove"
+            )
+
+        # Find platform auth NFT among the UTxOs fetched above
+        logger.info("Retrieving platform authentication NFT")
+        platform_auth_policy = ScriptHash(bytes.fromhex(tokens.platform_auth_policy))
+        platform_auth_utxo = next(
+            (
+                utxo
+                for utxo in platform_utxos
+                if utxo.output.amount.multi_asset
+                and platform_auth_policy in utxo.output.amount.multi_asset
+            ),
+            None,
+        )
+        assert platform_auth_utxo is not None, "Platform auth NFT not found"
+
+        # Build the scale transaction
+        logger.info(
+            f"Building scale-{direction} transaction: {reward_account_count} "
+            f"RewardAccount(s) + {aggstate_count} AggState(s)"
+        )
+        scale_oracle = (
+            self.governance_orchestrator.scale_up_oracle
+            if scaling_up
+            else self.governance_orchestrator.scale_down_oracle
+        )
+        scale_result = await scale_oracle(
+            oracle_policy=tokens.oracle_policy,
+            reward_account_count=reward_account_count,
+            aggstate_count=aggstate_count,
+            platform_utxo=platform_auth_utxo,
+            platform_script=platform_script,
+            change_address=self.oracle_addresses.admin_address,
+            signing_key=self.loaded_key.payment_sk,
+        )
+
+        assert (
+            scale_result.status == ProcessStatus.TRANSACTION_BUILT
+        ), f"Scale-{direction} transaction failed to build: {scale_result.error}"
+
+        logger.info(
+            f"Scale-{direction} transaction built successfully: "
+            f"{scale_result.transaction.id}"
+        )
+
+        # Sign and submit the transaction
+        logger.info(f"Signing and submitting scale-{direction} transaction")
+        transaction_status, _ = await self.tx_manager.sign_and_submit(
+            scale_result.transaction,
+            [self.loaded_key.payment_sk],
+            wait_confirmation=False,
+        )
+
+        logger.info(
+            f"Scale-{direction} transaction submission status: {transaction_status}"
+        )
+        assert (
+            transaction_status == "submitted"
+        ), f"Scale-{direction} transaction failed with status: {transaction_status}"
+
+        # Calculate expected counts after the scale transaction
+        expected_agg_state_count = initial_agg_state_count + sign * aggstate_count
+        expected_reward_account_count = (
+            initial_reward_account_count + sign * reward_account_count
+        )
+        logger.info(
+            f"Expected AggState UTxOs: {expected_agg_state_count}, "
+            f"Expected RewardAccount UTxOs: {expected_reward_account_count}"
+        )
+
+        # AFTER: Poll until the script address reflects the change, which covers
+        # both confirmation and indexing
+        logger.info(f"Verifying UTxOs were {action} correctly")
+        final_agg_state_count, final_reward_account_count = await poll_until(
+            self.snapshot_oracle_counts,
+            predicate=lambda counts: counts
+            == (expected_agg_state_count, expected_reward_account_count),
+            timeout=self.chain_query.confirmation_timeout,
+        )
+
+        logger.info(f"Final AggState UTxOs: {final_agg_state_count}")
+        logger.info(f"Final RewardAccount UTxOs: {final_reward_account_count}")
+
+        assert expected_agg_state_count == final_agg_state_count, (
+            f"AggState UTxO count mismatch: Expected {expected_agg_state_count} UTxOs "
+            f"(initial {initial_agg_state_count}, {aggstate_count} {action}), "
+            f"but found {final_agg_state_count} UTxOs in the blockchain"
+        )
+        assert expected_reward_account_count == final_reward_account_count, (
+            f"RewardAccount UTxO count mismatch: Expected "
+            f"{expected_reward_account_count} UTxOs (initial "
+            f"{initial_reward_account_count}, {reward_account_count} {action}), "
+            f"but found {final_reward_account_count} UTxOs in the blockchain"
+        )
+
+        logger.info(f"Scale-{direction} operation completed successfully")
@@ -6,11 +6,9 @@ added through governance transactions and ensures the configuration is
 correctly updated with the expected number of nodes.
 """
 
+import asyncio
 from collections.abc import Callable
 
-import pytest
-from pycardano import Address, ScriptHash
-
 from charli3_offchain_core.constants.status import ProcessStatus
 from charli3_offchain_core.oracle.utils.common import get_script_utxos
 from charli3_offchain_core.oracle.utils.state_checks import (
@@ -52,7 +50,6 @@ class TestAddNodes(GovernanceBase):
         super().setup_method(method)
         logger.info("TestAddNodes setup completed")
 
-    @pytest.mark.asyncio
     async def test_add_nodes(self) -> None:
         """Test the process of adding nodes to oracle settings.
 
@@ -86,32 +83,31 @@ class TestAddNodes(GovernanceBase):
 
         # Check the current allowed Nodes inside the configuration (BEFORE transaction)
         initial_utxos = await get_script_utxos(
-            Address.from_primitive(self.oracle_addresses.script_address),
+            self._script_address,
             self.tx_manager,
         )
 
         initial_oracle_datum, _ = get_oracle_settings_by_policy_id(
             initial_utxos,
-            ScriptHash(bytes.fromhex(self.management_config.tokens.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         # Log current node count in the UTxO's datum
         initial_node_count = len(initial_oracle_datum.nodes)
         logger.info(f"Initial nodes in UTxO datum: {initial_node_count}")
 
-        # Find platform auth NFT at the platform address
-        platform_auth_utxo = await self.platform_auth_finder.find_auth_utxo(
-            policy_id=self.management_config.tokens.platform_auth_policy,
-            platform_address=self.oracle_addresses.platform_address,
-        )
-
-        # Get platform script
+        # Find platform auth NFT and script at the platform address
         logger.info(
             f"Getting platform script for address: {self.oracle_addresses.platform_address}"
         )
-
-        platform_script = await self.platform_auth_finder.get_platform_script(
-            str(self.oracle_addresses.platform_address)
+        platform_auth_utxo, platform_script = await asyncio.gather(
+            self.platform_auth_finder.find_auth_utxo(
+                policy_id=self.management_config.tokens.platform_auth_policy,
+                platform_address=self.oracle_addresses.platform_address,
+            ),
+            self.platform_auth_finder.get_platform_script(
+                str(self.oracle_addresses.platform_address)
+            ),
         )
 
         # Prepare nodes to add while maintaining the same signature threshold
@@ -166,17 +162,22 @@ class TestAddNodes(GovernanceBase):
         ), f"Transaction failed with status: {transaction_status}"
 
         # Wait for UTxOs to be indexed
-        await wait_for_indexing(5)
+        await wait_for_indexing(
+            30,
+            chain_query=self.chain_query,
+            address=self.oracle_addresses.script_address,
+            tx_id=addition_result.transaction.id,
+        )
 
         # Check the current allowed Nodes inside the configuration (AFTER transaction)
         updated_utxos = await get_script_utxos(
-            Address.from_primitive(self.oracle_addresses.script_address),
+            self._script_address,
             self.tx_manager,
         )
 
         updated_oracle_datum, _ = get_oracle_settings_by_policy_id(
             updated_utxos,
-            ScriptHash(bytes.fromhex(self.management_config.tokens.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         # Log current node count in the UTxO's datum
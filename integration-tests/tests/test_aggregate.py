@@ -79,7 +79,7 @@ class TestAggregate(TestBase):
         self.odv_builder = OracleTransactionBuilder(
             tx_manager=self.tx_manager,
             script_address=self.oracle_script_address,
-            policy_id=ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+            policy_id=self._oracle_script_hash,
             reward_token_hash=reward_token_hash,
             reward_token_name=(
                 AssetName(reward_token_name) if reward_token_name else None
@@ -153,7 +153,12 @@ class TestAggregate(TestBase):
                 logger.warning(f"Fuel creation failed with status: {status}")
             else:
                 logger.info("Fuel UTxO created successfully")
-                await wait_for_indexing()
+                await wait_for_indexing(
+                    30,
+                    chain_query=self.chain_query,
+                    address=self.admin_address,
+                    tx_id=tx.id,
+                )
 
         except Exception as e:
             logger.warning(f"Failed to create fuel UTxO: {e}")
@@ -174,7 +179,7 @@ class TestAggregate(TestBase):
 
         # Get current time for all messages
         current_time = self.tx_manager.chain_query.get_current_posix_chain_time_ms()
-        policy_id_bytes = bytes.fromhex(self.token_config.oracle_policy)
+        policy_id_bytes = self._oracle_script_hash.payload
 
         for skey, vkey, _ in self.node_keys:
             # Generate feed with random variance
@@ -205,7 +210,6 @@ class TestAggregate(TestBase):
 
         return feeds
 
-    @pytest.mark.asyncio
     @pytest.mark.run(order=3.1)
     async def test_odv_transaction(self) -> None:
         """Test the ODV transaction with simulated node feeds."""
@@ -257,8 +261,13 @@ class TestAggregate(TestBase):
         assert status == "confirmed", f"ODV transaction failed with status: {status}"
         logger.info(f"ODV transaction confirmed: {odv_result.transaction.id}")
 
-        # 8. Wait for indexing before verification
-        await wait_for_indexing(10)
+        # 8. Wait for the new outputs to be indexed before verification
+        await wait_for_indexing(
+            30,
+            chain_query=self.chain_query,
+            address=self.oracle_script_address,
+            tx_id=odv_result.transaction.id,
+        )
 
         # 9. Verify state changes
         await self.verify_odv_outputs(expected_median)
@@ -276,7 +285,7 @@ class TestAggregate(TestBase):
         # Check for valid agg state UTxO
         agg_states = asset_checks.filter_utxos_by_token_name(
             utxos,
-            ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+            self._oracle_script_hash,
             "C3AS",
         )
 
@@ -321,7 +330,7 @@ class TestAggregate(TestBase):
         # Check reward account exists
         _, reward_account_utxo = state_checks.get_reward_account_by_policy_id(
             utxos,
-            ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         assert reward_account_utxo is not None, "Reward account UTxO not found"
@@ -0,0 +1,79 @@
+"""Test the retry helper used by the integration tests.
+
+These tests need no devnet; they check which chain errors async_retry treats
+as transient when given TRANSIENT_CHAIN_ERRORS.
+"""
+
+import pytest
+import requests
+from blockfrost import ApiError
+from pycardano import TransactionFailedException
+
+from charli3_offchain_core.blockchain.exceptions import (
+    TransactionSubmissionError,
+    UTxOQueryError,
+)
+
+from .async_utils import async_retry
+from .base import TRANSIENT_CHAIN_ERRORS
+
+
+def api_error(status_code: int) -> ApiError:
+    """Build a Blockfrost API error for an empty response with the given status."""
+    response = requests.Response()
+    response.status_code = status_code
+    return ApiError(response)
+
+
+class FailingCall:
+    """Coroutine callable that raises the given errors before succeeding."""
+
+    def __init__(self, *errors: Exception) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestTransientChainErrors:
+    """Test retrying on TRANSIENT_CHAIN_ERRORS."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            TransactionSubmissionError("submit failed"),
+            UTxOQueryError("query failed"),
+            TransactionFailedException("rejected by the node"),
+            api_error(500),
+            requests.exceptions.ConnectionError("connection reset"),
+            requests.exceptions.ReadTimeout("read timed out"),
+            ConnectionError("connection refused"),
+            TimeoutError("timed out"),
+        ],
+        ids=lambda error: type(error).__name__,
+    )
+    async def test_transient_error_is_retried(self, error: Exception) -> None:
+        """A transient chain error is retried until the call succeeds."""
+        call = FailingCall(error)
+        retrying = async_retry(tries=2, delay=0, exceptions=TRANSIENT_CHAIN_ERRORS)
+
+        assert await retrying(call)() == "ok"
+        assert call.calls == 2
+
+    @pytest.mark.parametrize(
+        "error",
+        [ValueError("bad config"), KeyError("missing key")],
+        ids=lambda error: type(error).__name__,
+    )
+    async def test_other_error_fails_fast(self, error: Exception) -> None:
+        """Configuration and validation errors are raised on the first attempt."""
+        call = FailingCall(error)
+        retrying = async_retry(tries=3, delay=0, exceptions=TRANSIENT_CHAIN_ERRORS)
+
+        with pytest.raises(type(error)):
+            await retrying(call)()
+        assert call.calls == 1
@@ -5,15 +5,14 @@ from collections.abc import Callable
 import pytest
 
 from charli3_offchain_core.constants.status import ProcessStatus
-from charli3_offchain_core.oracle.utils.common import get_script_utxos
 
 from .base import TestBase
 from .test_utils import (
     find_oracle_policy_hash,
     find_platform_auth_nft,
     logger,
+    poll_until,
     update_config_file,
-    wait_for_indexing,
 )
 
 
@@ -27,7 +26,6 @@ class TestDeployment(TestBase):
         super().setup_method(method)
         logger.info("TestDeployment setup complete")
 
-    @pytest.mark.asyncio
     async def test_deployment(self) -> None:
         """Test oracle deployment with platform auth NFT."""
         logger.info("Starting oracle deployment test")
@@ -105,32 +103,30 @@ class TestDeployment(TestBase):
         )
 
         logger.info(f"Deployment transaction submission status: {status}")
-        # Extract the oracle policy ID from the result
-        oracle_policy_id = result.start_result.minting_policy_id
 
         assert (
             status == "confirmed"
         ), f"Deployment transaction failed with status: {status}"
 
-        # Wait for UTxOs to be indexed
-        await wait_for_indexing(5)
-
-        # Check that UTxOs exist at the oracle script address
+        # Poll until the new UTxOs are indexed at the oracle script address
         logger.info(
             f"Checking for UTxOs at oracle script address: {self.oracle_script_address}"
         )
-        utxos = await get_script_utxos(self.oracle_script_address, self.tx_manager)
+        utxos = await poll_until(
+            lambda: self.chain_query.get_utxos(self.oracle_script_address)
+        )
         logger.info(f"Found {len(utxos)} UTxOs at oracle script address")
         assert (
             len(utxos) > 0
         ), "No UTxOs found at oracle script address after deployment"
 
-        # Update the configuration file with the new params
+        # Update the configuration file with the new oracle details
+        oracle_policy_id = find_oracle_policy_hash(utxos, "C3CS")
         logger.info(
             f"Updating configuration file with new oracle script address: {self.oracle_script_address}"
         )
         logger.info(
-            f"Updating configuration file with new oracle policy id: {oracle_policy_id}"
+            f"Updating configuration file with new oracle policy ID: {oracle_policy_id}"
         )
         update_config_file(
             self.config_path,
@@ -140,13 +136,4 @@ class TestDeployment(TestBase):
             },
         )
 
-        # Update the configuration file with the new oracle policy id
-        oracle_policy_id = find_oracle_policy_hash(utxos, "C3CS")
-        logger.info(
-            f"Updating configuration file with new oracle policy ID: {oracle_policy_id}"
-        )
-        update_config_file(
-            self.config_path,
-            {"tokens.oracle_policy": oracle_policy_id},
-        )
         logger.info("Oracle deployment test completed successfully")
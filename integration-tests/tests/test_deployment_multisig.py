@@ -5,8 +5,6 @@ from pathlib import Path
 
 import pytest
 from pycardano import (
-    PaymentExtendedSigningKey,
-    PaymentVerificationKey,
     ScriptAll,
     ScriptNofK,
     ScriptPubkey,
@@ -14,15 +12,16 @@ from pycardano import (
 )
 
 from charli3_offchain_core.constants.status import ProcessStatus
-from charli3_offchain_core.oracle.utils.common import get_script_utxos
 
 from .base import TestBase
 from .test_utils import (
     find_oracle_policy_hash,
     find_platform_auth_nft,
+    load_platform_party_keys,
     logger,
+    poll_until,
+    read_platform_parties,
     update_config_file,
-    wait_for_indexing,
 )
 
 
@@ -58,39 +57,31 @@ class TestMultisigDeployment(TestBase):
             self.platform_keys = []
             return
 
+        # Read every administrator key hash once for both config and keys
+        platform_parties = read_platform_parties(self.platform_keys_dir)
+
         # Load platform configuration
         (self.required_signers, self.parties) = self.load_platform_config(
-            self.platform_keys_dir
+            self.platform_keys_dir, platform_parties
         )
         logger.info(f"Loaded {len(self.parties)} platform administrators from config")
         logger.info(f"Configured with {self.required_signers} required signers")
 
         # Load platform signing keys
-        self.platform_keys = []
-        for platform_dir in sorted(self.platform_keys_dir.glob("platform_*")):
-            try:
-                skey = PaymentExtendedSigningKey.load(
-                    str(platform_dir / "administrator.skey")
-                )
-                vkey = PaymentVerificationKey.load(
-                    str(platform_dir / "administrator.vkey")
-                )
-                vkh = VerificationKeyHash(
-                    bytes.fromhex(
-                        (platform_dir / "administrator.vkh").read_text().strip()
-                    )
-                )
-                self.platform_keys.append((skey, vkey, vkh))
-                logger.info(f"Loaded platform key: {vkh}")
-            except Exception as e:
-                logger.warning(f"Failed to load key from {platform_dir}: {e}")
-
-    def load_platform_config(self, platform_dir: Path) -> tuple[int, list[str]]:
+        self.platform_keys = load_platform_party_keys(platform_parties)
+
+    def load_platform_config(
+        self,
+        platform_dir: Path,
+        platform_parties: list[tuple[Path, str]] | None = None,
+    ) -> tuple[int, list[str]]:
         """
         Load platform multisig configuration from the specified directory.
 
         Args:
             platform_dir: Directory containing platform configuration files
+            platform_parties: Already read administrator key hashes, read from
+                ``platform_dir`` when not given
 
         Returns:
             Tuple containing:
@@ -108,17 +99,12 @@ class TestMultisigDeployment(TestBase):
             return (1, [])
 
         # Load all platform administrator configurations
-        parties = []
-        for admin_dir in sorted(platform_dir.glob("platform_*")):
-            try:
-                vkh = (admin_dir / "administrator.vkh").read_text().strip()
-                parties.append(vkh)
-            except FileNotFoundError:
-                logger.warning(f"Missing vkh file in {admin_dir}")
+        if platform_parties is None:
+            platform_parties = read_platform_parties(platform_dir)
+        parties = [vkh for _, vkh in platform_parties]
 
         return (required_sigs, parties)
 
-    @pytest.mark.asyncio
     async def test_deployment_with_multisig(self) -> None:
         """Test oracle deployment with multisignature configuration."""
         logger.info("Starting oracle deployment test with multisignature")
@@ -229,14 +215,13 @@ class TestMultisigDeployment(TestBase):
             status == "confirmed"
         ), f"Deployment transaction failed with status: {status}"
 
-        # Wait for UTxOs to be indexed
-        await wait_for_indexing(5)
-
-        # Check that UTxOs exist at the oracle script address
+        # Poll until the new UTxOs are indexed at the oracle script address
         logger.info(
             f"Checking for UTxOs at oracle script address: {self.oracle_script_address}"
         )
-        utxos = await get_script_utxos(self.oracle_script_address, self.tx_manager)
+        utxos = await poll_until(
+            lambda: self.chain_query.get_utxos(self.oracle_script_address)
+        )
         logger.info(f"Found {len(utxos)} UTxOs at oracle script address")
         assert (
             len(utxos) > 0
@@ -38,7 +38,6 @@ class TestDismissRewards(TestBase):
 
         logger.info("TestDismissRewards setup complete")
 
-    @pytest.mark.asyncio
     @async_retry(tries=TEST_RETRIES, delay=5)
     async def test_dismiss_rewards(self) -> None:
         """Test dismissing rewards."""
@@ -145,8 +144,13 @@ class TestDismissRewards(TestBase):
                 f"Dismiss rewards transaction confirmed: {result.transaction.id}"
             )
 
-            # 5. Wait for indexing
-            await wait_for_indexing(10)
+            # 5. Wait for the dismissed rewards to be indexed
+            await wait_for_indexing(
+                30,
+                chain_query=self.chain_query,
+                address=self.platform_address,
+                tx_id=result.transaction.id,
+            )
 
             # 6. Verify rewards were dismissed (accounts emptied)
             await self.verify_dismiss_rewards(initial_platform_balance)
@@ -182,9 +186,6 @@ class TestDismissRewards(TestBase):
         """Verify that rewards were correctly dismissed."""
         logger.info("Verifying dismiss rewards")
 
-        # Get UTxOs at script address
-        await self.chain_query.get_utxos(self.oracle_script_address)
-
         # Check platform balance increase
         new_platform_utxos = await self.chain_query.get_utxos(self.platform_address)
         new_platform_balance = self._calculate_balance(new_platform_utxos)
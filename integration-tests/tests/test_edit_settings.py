@@ -5,14 +5,12 @@ governance system. It verifies that settings can be properly modified and
 that these modifications are correctly persisted on the blockchain.
 """
 
+import asyncio
 from collections.abc import Callable
 from copy import deepcopy
 from typing import Any
 from unittest.mock import patch
 
-import pytest
-from pycardano import Address, ScriptHash
-
 from charli3_offchain_core.constants.status import ProcessStatus
 from charli3_offchain_core.models.oracle_datums import (
     OracleSettingsDatum,
@@ -95,7 +93,6 @@ class TestEditSettings(GovernanceBase):
 
         return OracleSettingsVariant(new_settings)
 
-    @pytest.mark.asyncio
     @patch(
         "charli3_offchain_core.oracle.governance.update_builder.manual_settings_menu"
     )
@@ -134,14 +131,14 @@ class TestEditSettings(GovernanceBase):
 
         # Retrieve the current UTxOs (BEFORE changes)
         initial_utxos = await get_script_utxos(
-            Address.from_primitive(self.oracle_addresses.script_address),
+            self._script_address,
             self.tx_manager,
         )
 
         # Obtain the current Oracle configuration
         initial_oracle_datum, initial_settings_utxo = get_oracle_settings_by_policy_id(
             initial_utxos,
-            ScriptHash(bytes.fromhex(self.management_config.tokens.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         initial_sig_threshold = initial_oracle_datum.required_node_signatures_count
@@ -167,19 +164,18 @@ class TestEditSettings(GovernanceBase):
         # Set up the mock to return the modified configuration
         mock_manual_settings_menu.return_value = modified_settings_utxo
 
-        # Find platform auth NFT at the platform address
-        platform_auth_utxo = await self.platform_auth_finder.find_auth_utxo(
-            policy_id=self.management_config.tokens.platform_auth_policy,
-            platform_address=self.oracle_addresses.platform_address,
-        )
-
-        # Get platform script
+        # Find platform auth NFT and script at the platform address
         logger.info(
             f"Getting platform script for address: {self.oracle_addresses.platform_address}"
         )
-
-        platform_script = await self.platform_auth_finder.get_platform_script(
-            str(self.oracle_addresses.platform_address)
+        platform_auth_utxo, platform_script = await asyncio.gather(
+            self.platform_auth_finder.find_auth_utxo(
+                policy_id=self.management_config.tokens.platform_auth_policy,
+                platform_address=self.oracle_addresses.platform_address,
+            ),
+            self.platform_auth_finder.get_platform_script(
+                str(self.oracle_addresses.platform_address)
+            ),
         )
 
         # Build the transaction to update settings
@@ -215,17 +211,22 @@ class TestEditSettings(GovernanceBase):
         ), f"Transaction failed with status: {transaction_status}"
 
         # Wait for UTxOs to be indexed with additional time for settings updates
-        await wait_for_indexing(5)
+        await wait_for_indexing(
+            30,
+            chain_query=self.chain_query,
+            address=self.oracle_addresses.script_address,
+            tx_id=update_result.transaction.id,
+        )
 
         # Verify that the configuration has been updated correctly (AFTER changes)
         updated_utxos = await get_script_utxos(
-            Address.from_primitive(self.oracle_addresses.script_address),
+            self._script_address,
             self.tx_manager,
         )
 
         updated_oracle_datum, _ = get_oracle_settings_by_policy_id(
             updated_utxos,
-            ScriptHash(bytes.fromhex(self.management_config.tokens.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         # Get the actual updated signature threshold
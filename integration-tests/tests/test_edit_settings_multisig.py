@@ -1,17 +1,15 @@
 """Test module for Oracle governance using multisig."""
 
+import asyncio
 from collections.abc import Callable
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
-import pytest
 from pycardano import (
-    Address,
     PaymentExtendedSigningKey,
     PaymentVerificationKey,
-    ScriptHash,
     VerificationKeyHash,
 )
 
@@ -27,6 +25,7 @@ from charli3_offchain_core.oracle.utils.state_checks import (
 
 from .governance import GovernanceBase
 from .test_utils import (
+    load_key_cached,
     logger,
     wait_for_indexing,
 )
@@ -127,10 +126,12 @@ class TestMultisigGovernance(GovernanceBase):
         self.platform_keys = []
         for key_dir in sorted(self.platform_keys_dir.glob("platform_*")):
             try:
-                skey = PaymentExtendedSigningKey.load(
-                    str(key_dir / "administrator.skey")
+                skey = load_key_cached(
+                    PaymentExtendedSigningKey, key_dir / "administrator.skey"
+                )
+                vkey = load_key_cached(
+                    PaymentVerificationKey, key_dir / "administrator.vkey"
                 )
-                vkey = PaymentVerificationKey.load(str(key_dir / "administrator.vkey"))
                 vkh = VerificationKeyHash(
                     bytes.fromhex((key_dir / "administrator.vkh").read_text().strip())
                 )
@@ -139,7 +140,6 @@ class TestMultisigGovernance(GovernanceBase):
             except Exception as e:
                 logger.warning(f"Could not load key from {key_dir}: {e}")
 
-    @pytest.mark.asyncio
     @patch(
         "charli3_offchain_core.oracle.governance.update_builder.manual_settings_menu"
     )
@@ -152,12 +152,12 @@ class TestMultisigGovernance(GovernanceBase):
 
         # Retrieve current settings
         initial_utxos = await get_script_utxos(
-            Address.from_primitive(self.oracle_addresses.script_address),
+            self._script_address,
             self.tx_manager,
         )
         initial_oracle_datum, initial_settings_utxo = get_oracle_settings_by_policy_id(
             initial_utxos,
-            ScriptHash(bytes.fromhex(self.management_config.tokens.oracle_policy)),
+            self._oracle_script_hash,
         )
         initial_sig_threshold = initial_oracle_datum.required_node_signatures_count
 
@@ -172,12 +172,14 @@ class TestMultisigGovernance(GovernanceBase):
         mock_manual_settings_menu.return_value = modified_settings_utxo
 
         # Get platform UTxO and script
-        platform_auth_utxo = await self.platform_auth_finder.find_auth_utxo(
-            policy_id=self.management_config.tokens.platform_auth_policy,
-            platform_address=self.oracle_addresses.platform_address,
-        )
-        platform_script = await self.platform_auth_finder.get_platform_script(
-            str(self.oracle_addresses.platform_address)
+        platform_auth_utxo, platform_script = await asyncio.gather(
+            self.platform_auth_finder.find_auth_utxo(
+                policy_id=self.management_config.tokens.platform_auth_policy,
+                platform_address=self.oracle_addresses.platform_address,
+            ),
+            self.platform_auth_finder.get_platform_script(
+                str(self.oracle_addresses.platform_address)
+            ),
         )
 
         update_result = await self.governance_orchestrator.update_oracle(
@@ -215,16 +217,21 @@ class TestMultisigGovernance(GovernanceBase):
         )
         assert status == "confirmed", f"Transaction failed with status: {status}"
 
-        await wait_for_indexing(5)
+        await wait_for_indexing(
+            30,
+            chain_query=self.chain_query,
+            address=self.oracle_addresses.script_address,
+            tx_id=tx.id,
+        )
 
         # Verify settings were updated
         updated_utxos = await get_script_utxos(
-            Address.from_primitive(self.oracle_addresses.script_address),
+            self._script_address,
             self.tx_manager,
         )
         updated_oracle_datum, _ = get_oracle_settings_by_policy_id(
             updated_utxos,
-            ScriptHash(bytes.fromhex(self.management_config.tokens.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         actual_updated_threshold = updated_oracle_datum.required_node_signatures_count
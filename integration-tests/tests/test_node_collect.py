@@ -118,7 +118,6 @@ class TestNodeCollect(TestBase):
             logger.error(f"Failed to load node key: {e}")
             return None
 
-    @pytest.mark.asyncio
     @async_retry(tries=TEST_RETRIES, delay=5)
     async def test_node_collect(self) -> None:
         """Test node collection of rewards."""
@@ -150,13 +149,13 @@ class TestNodeCollect(TestBase):
             try:
                 reward_datum, _ = state_checks.get_reward_account_by_policy_id(
                     utxos,
-                    ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+                    self._oracle_script_hash,
                 )
 
                 # Get settings to find registered nodes
                 settings_datum, _ = state_checks.get_oracle_settings_by_policy_id(
                     utxos,
-                    ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+                    self._oracle_script_hash,
                 )
 
                 # Check if our node is registered
@@ -255,8 +254,13 @@ class TestNodeCollect(TestBase):
                         f"Node collect transaction confirmed: {result.transaction.id}"
                     )
 
-                    # 5. Wait for indexing
-                    await wait_for_indexing(10)
+                    # 5. Wait for the reward payout to be indexed
+                    await wait_for_indexing(
+                        30,
+                        chain_query=self.chain_query,
+                        address=node_address,
+                        tx_id=result.transaction.id,
+                    )
 
                     # 6. Verify the reward was collected
                     await self.verify_reward_collection(
@@ -315,13 +319,13 @@ class TestNodeCollect(TestBase):
         # Check reward account
         new_reward_datum, _ = state_checks.get_reward_account_by_policy_id(
             utxos,
-            ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         # Get settings to find registered nodes
         settings_datum, _ = state_checks.get_oracle_settings_by_policy_id(
             utxos,
-            ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         # 1. Verify rewards were zeroed out in the reward account
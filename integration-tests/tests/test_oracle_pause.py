@@ -1,18 +1,18 @@
 """Test the pause/resume functionality of the Charli3 ODV Oracle."""
 
+import asyncio
 from collections.abc import Callable
 
 import pytest
-from pycardano import ScriptHash
 
 from charli3_offchain_core.cli.setup import setup_management_from_config
-from charli3_offchain_core.models.oracle_datums import NoDatum
+from charli3_offchain_core.models.oracle_datums import NoDatum, OracleSettingsDatum
 from charli3_offchain_core.oracle.lifecycle.orchestrator import LifecycleOrchestrator
 from charli3_offchain_core.oracle.utils import common, state_checks
 
 from .async_utils import async_retry
 from .base import TEST_RETRIES, TestBase
-from .test_utils import logger, wait_for_indexing
+from .test_utils import logger, poll_until
 
 
 @pytest.mark.run(order=6)
@@ -33,7 +33,7 @@ class TestOraclePause(TestBase):
             chain_query,
             tx_manager,
             self.platform_auth_finder,
-        ) = setup_management_from_config(self.config_path)
+        ) = setup_management_from_config(self.config_path, chain_query=self.chain_query)
 
         self.lifecycle_orchestrator = LifecycleOrchestrator(
             chain_query=chain_query,
@@ -42,25 +42,25 @@ class TestOraclePause(TestBase):
             ref_script_config=self.ref_script_config,
         )
 
-    @pytest.mark.asyncio
     @pytest.mark.run(order=6.1)
     @async_retry(tries=TEST_RETRIES, delay=5)
     async def test_oracle_pause(self) -> None:
         """Test oracle pause."""
         # Prepare the transaction
-        platform_utxo = await self.platform_auth_finder.find_auth_utxo(
-            policy_id=self.management_config.tokens.platform_auth_policy,
-            platform_address=self.oracle_addresses.platform_address,
+        platform_utxo, platform_script = await asyncio.gather(
+            self.platform_auth_finder.find_auth_utxo(
+                policy_id=self.management_config.tokens.platform_auth_policy,
+                platform_address=self.oracle_addresses.platform_address,
+            ),
+            self.platform_auth_finder.get_platform_script(
+                self.oracle_addresses.platform_address
+            ),
         )
 
         assert (
             platform_utxo is not None
         ), "No platform auth UTxO found for oracle pause test"
 
-        platform_script = await self.platform_auth_finder.get_platform_script(
-            self.oracle_addresses.platform_address
-        )
-
         result = await self.lifecycle_orchestrator.pause_oracle(
             oracle_policy=self.management_config.tokens.oracle_policy,
             platform_utxo=platform_utxo,
@@ -82,18 +82,25 @@ class TestOraclePause(TestBase):
 
         logger.info("Oracle pause transaction submitted")
 
-        # Verify that the oracle was paused
-        await wait_for_indexing(10)
-
-        utxos = await common.get_script_utxos(
-            self.oracle_addresses.script_address, self.lifecycle_orchestrator.tx_manager
-        )
-        policy_hash = ScriptHash.from_primitive(
-            self.management_config.tokens.oracle_policy
-        )
-        settings_datum, _settings_utxo = state_checks.get_oracle_settings_by_policy_id(
-            utxos, policy_hash
+        # Verify that the oracle was paused, polling until the indexer has the
+        # updated settings
+        async def fetch_settings() -> OracleSettingsDatum | None:
+            utxos = await common.get_script_utxos(
+                self.oracle_addresses.script_address,
+                self.lifecycle_orchestrator.tx_manager,
+            )
+            settings_datum, _settings_utxo, _ = state_checks.scan_script_utxos(
+                utxos, self._oracle_script_hash, "C3CS"
+            )
+            return settings_datum
+
+        settings_datum = await poll_until(
+            fetch_settings,
+            predicate=lambda datum: (
+                datum is not None and datum.pause_period_started_at != NoDatum()
+            ),
         )
+        assert settings_datum is not None, "Oracle settings UTxO not found"
         assert (
             settings_datum.pause_period_started_at != NoDatum()
         ), "Oracle pause timestamp not found after creation"
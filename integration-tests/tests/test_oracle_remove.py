@@ -1,24 +1,29 @@
 """Test the remove functionality of the Charli3 ODV Oracle."""
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterator
 
 import pytest
-from pycardano import ScriptHash
+from pycardano import UTxO
 
 from charli3_offchain_core.cli.setup import setup_management_from_config
-from charli3_offchain_core.models.oracle_datums import NoDatum
+from charli3_offchain_core.models.oracle_datums import NoDatum, OracleSettingsDatum
 from charli3_offchain_core.oracle.lifecycle.orchestrator import LifecycleOrchestrator
-from charli3_offchain_core.oracle.utils import asset_checks, common, state_checks
+from charli3_offchain_core.oracle.utils import common, state_checks
 
 from .async_utils import async_retry
 from .base import TEST_RETRIES, TestBase
-from .test_utils import logger, wait_for_indexing
+from .test_utils import logger, poll_until, wait_for_indexing
+
+REMOVE_TTL_OFFSET = 600
 
 
 @pytest.mark.run(order=10)
 class TestOracleRemove(TestBase):
     """Test oracle Remove/resume."""
 
+    _ttl_override_logged = False
+
     def setup_method(self, method: "Callable") -> None:
         """Set up the test environment."""
         logger.info("Setting up TestOracleRemove environment")
@@ -33,7 +38,7 @@ class TestOracleRemove(TestBase):
             chain_query,
             tx_manager,
             self.platform_auth_finder,
-        ) = setup_management_from_config(self.config_path)
+        ) = setup_management_from_config(self.config_path, chain_query=self.chain_query)
 
         self.lifecycle_orchestrator = LifecycleOrchestrator(
             chain_query=chain_query,
@@ -42,32 +47,46 @@ class TestOracleRemove(TestBase):
             ref_script_config=self.ref_script_config,
         )
 
-        # OVERRIDE: Increase TTL offset for this test
-        # The remove transaction seems to be particularly sensitive to validity interval
-        self.lifecycle_orchestrator.tx_manager.config.ttl_offset = 600
-        logger.info(
-            f"Overridden ttl_offset to {self.lifecycle_orchestrator.tx_manager.config.ttl_offset} for TestOracleRemove"
-        )
+    @pytest.fixture(autouse=True)
+    def _ttl_override(self) -> "Iterator[None]":
+        """Increase the TTL offset for the duration of a single test.
+
+        The remove transaction seems to be particularly sensitive to validity
+        interval, so the offset is raised and restored afterwards to keep the
+        shared tx_manager config untouched for other tests.
+        """
+        config = self.lifecycle_orchestrator.tx_manager.config
+        original_ttl_offset = config.ttl_offset
+        config.ttl_offset = REMOVE_TTL_OFFSET
+        if not TestOracleRemove._ttl_override_logged:
+            logger.info(
+                f"Overriding ttl_offset to {REMOVE_TTL_OFFSET} for TestOracleRemove"
+            )
+            TestOracleRemove._ttl_override_logged = True
+        try:
+            yield
+        finally:
+            config.ttl_offset = original_ttl_offset
 
-    @pytest.mark.asyncio
     @pytest.mark.run(order=10.1)
     @async_retry(tries=TEST_RETRIES, delay=5)
     async def test_oracle_pause(self) -> None:
         """Test oracle pause."""
         # Prepare the transaction
-        platform_utxo = await self.platform_auth_finder.find_auth_utxo(
-            policy_id=self.management_config.tokens.platform_auth_policy,
-            platform_address=self.oracle_addresses.platform_address,
+        platform_utxo, platform_script = await asyncio.gather(
+            self.platform_auth_finder.find_auth_utxo(
+                policy_id=self.management_config.tokens.platform_auth_policy,
+                platform_address=self.oracle_addresses.platform_address,
+            ),
+            self.platform_auth_finder.get_platform_script(
+                self.oracle_addresses.platform_address
+            ),
         )
 
         assert (
             platform_utxo is not None
         ), "No platform auth UTxO found for oracle pause test"
 
-        platform_script = await self.platform_auth_finder.get_platform_script(
-            self.oracle_addresses.platform_address
-        )
-
         result = await self.lifecycle_orchestrator.pause_oracle(
             oracle_policy=self.management_config.tokens.oracle_policy,
             platform_utxo=platform_utxo,
@@ -89,23 +108,29 @@ class TestOracleRemove(TestBase):
 
         logger.info("Oracle pause transaction submitted")
 
-        # Verify that the oracle was paused
-        await wait_for_indexing(10)
-
-        utxos = await common.get_script_utxos(
-            self.oracle_addresses.script_address, self.lifecycle_orchestrator.tx_manager
-        )
-        policy_hash = ScriptHash.from_primitive(
-            self.management_config.tokens.oracle_policy
-        )
-        settings_datum, _settings_utxo = state_checks.get_oracle_settings_by_policy_id(
-            utxos, policy_hash
-        )
+        # Verify that the oracle was paused, polling until the indexer has the
+        # updated settings
+        async def fetch_settings() -> OracleSettingsDatum | None:
+            utxos = await common.get_script_utxos(
+                self.oracle_addresses.script_address,
+                self.lifecycle_orchestrator.tx_manager,
+            )
+            settings_datum, _settings_utxo, _ = state_checks.scan_script_utxos(
+                utxos, self._oracle_script_hash, "C3CS"
+            )
+            return settings_datum
+
+        settings_datum = await poll_until(
+            fetch_settings,
+            predicate=lambda datum: (
+                datum is not None and datum.pause_period_started_at != NoDatum()
+            ),
+        )
+        assert settings_datum is not None, "Oracle settings UTxO not found"
         assert (
             settings_datum.pause_period_started_at != NoDatum()
         ), "Oracle pause timestamp not found after creation"
 
-    @pytest.mark.asyncio
     @pytest.mark.run(order=10.2)
     @async_retry(tries=TEST_RETRIES, delay=5)
     async def test_oracle_remove(self) -> None:
@@ -117,19 +142,20 @@ class TestOracleRemove(TestBase):
         await wait_for_indexing(352)
 
         # Prepare the transaction
-        platform_utxo = await self.platform_auth_finder.find_auth_utxo(
-            policy_id=self.management_config.tokens.platform_auth_policy,
-            platform_address=self.oracle_addresses.platform_address,
+        platform_utxo, platform_script = await asyncio.gather(
+            self.platform_auth_finder.find_auth_utxo(
+                policy_id=self.management_config.tokens.platform_auth_policy,
+                platform_address=self.oracle_addresses.platform_address,
+            ),
+            self.platform_auth_finder.get_platform_script(
+                self.oracle_addresses.platform_address
+            ),
         )
 
         assert (
             platform_utxo is not None
         ), "No platform auth UTxO found for oracle remove test"
 
-        platform_script = await self.platform_auth_finder.get_platform_script(
-            self.oracle_addresses.platform_address
-        )
-
         result = await self.lifecycle_orchestrator.remove_oracle(
             oracle_policy=self.management_config.tokens.oracle_policy,
             platform_utxo=platform_utxo,
@@ -152,16 +178,19 @@ class TestOracleRemove(TestBase):
 
         logger.info("Oracle remove transaction submitted")
 
-        # Verify that the oracle was removed
-        await wait_for_indexing(10)
-
-        utxos = await common.get_script_utxos(
-            self.oracle_addresses.script_address, self.lifecycle_orchestrator.tx_manager
-        )
-        policy_hash = ScriptHash.from_primitive(
-            self.management_config.tokens.oracle_policy
-        )
-        core_oracle_utxos = asset_checks.filter_utxos_by_token_name(
-            utxos, policy_hash, "C3CS"
+        # Verify that the oracle was removed, polling until the indexer drops the
+        # core settings UTxO
+        async def fetch_core_utxos() -> list[UTxO]:
+            # The script address may be left empty, which get_script_utxos rejects
+            utxos = await self.chain_query.get_utxos(
+                self.oracle_addresses.script_address
+            )
+            _, _, core_oracle_utxos = state_checks.scan_script_utxos(
+                utxos, self._oracle_script_hash, "C3CS", "C3CS"
+            )
+            return core_oracle_utxos
+
+        core_oracle_utxos = await poll_until(
+            fetch_core_utxos, predicate=lambda core_utxos: core_utxos == []
         )
         assert core_oracle_utxos == [], "Oracle was not removed"
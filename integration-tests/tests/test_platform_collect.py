@@ -1,5 +1,6 @@
 """Test platform collection of rewards in the Charli3 ODV Oracle."""
 
+import asyncio
 from collections.abc import Callable
 from unittest.mock import AsyncMock, patch
 
@@ -19,7 +20,7 @@ from charli3_offchain_core.oracle.utils import state_checks
 
 from .async_utils import async_retry
 from .base import TEST_RETRIES, TestBase
-from .test_utils import find_platform_auth_nft, logger, wait_for_indexing
+from .test_utils import find_platform_auth_nft, logger, poll_until
 
 
 @pytest.mark.run(order=5)
@@ -39,9 +40,22 @@ class TestPlatformCollect(TestBase):
             ref_script_config=self.ref_script_config,
         )
 
+        # Decode the reward token once; None means rewards are paid in ADA
+        self._reward_script_hash: ScriptHash | None = None
+        self._reward_token_name: AssetName | None = None
+        if (
+            self.token_config.reward_token_policy
+            and self.token_config.reward_token_name
+        ):
+            self._reward_script_hash = ScriptHash(
+                bytes.fromhex(self.token_config.reward_token_policy)
+            )
+            self._reward_token_name = AssetName(
+                bytes.fromhex(self.token_config.reward_token_name)
+            )
+
         logger.info("TestPlatformCollect setup complete")
 
-    @pytest.mark.asyncio
     @async_retry(tries=TEST_RETRIES, delay=5)
     async def test_platform_collect(self) -> None:
         """Test platform collection of rewards."""
@@ -53,15 +67,19 @@ class TestPlatformCollect(TestBase):
             new=AsyncMock(return_value=self.platform_address),
         ):
             # 1. First, check if there are rewards to collect
-            # Get UTxOs at script address
-            utxos = await self.chain_query.get_utxos(self.oracle_script_address)
+            # Get UTxOs at script address, along with the platform address UTxOs
+            # needed for the initial balance
+            utxos, initial_platform_utxos = await asyncio.gather(
+                self.chain_query.get_utxos(self.oracle_script_address),
+                self.chain_query.get_utxos(self.platform_address),
+            )
 
             # Check reward account
             try:
                 reward_datum, reward_utxo = (
                     state_checks.get_reward_account_by_policy_id(
                         utxos,
-                        ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+                        self._oracle_script_hash,
                     )
                 )
 
@@ -114,9 +132,6 @@ class TestPlatformCollect(TestBase):
                 )
 
                 # Get initial platform address balance
-                initial_platform_utxos = await self.chain_query.get_utxos(
-                    self.platform_address
-                )
                 initial_platform_balance = self._calculate_balance(
                     initial_platform_utxos
                 )
@@ -158,8 +173,17 @@ class TestPlatformCollect(TestBase):
                         f"Platform collect transaction confirmed: {result.transaction.id}"
                     )
 
-                    # 7. Wait for indexing
-                    await wait_for_indexing(10)
+                    # 7. Wait until the collect outputs are indexed
+                    async def collect_indexed() -> bool:
+                        utxos = await self.chain_query.get_utxos(
+                            self.oracle_script_address
+                        )
+                        return any(
+                            utxo.input.transaction_id == result.transaction.id
+                            for utxo in utxos
+                        )
+
+                    await poll_until(collect_indexed, timeout=15)
 
                     # 8. Verify platform rewards were collected
                     await self.verify_platform_reward_collection(
@@ -175,54 +199,22 @@ class TestPlatformCollect(TestBase):
                 logger.error(f"Error in platform collect test: {e}")
                 raise
 
+    def _utxo_reward(self, utxo: UTxO) -> int:
+        """Get the reward amount held by a UTxO (tokens or ADA)."""
+        if self._reward_script_hash is None:
+            return utxo.output.amount.coin
+
+        multi_asset = utxo.output.amount.multi_asset
+        tokens = multi_asset.get(self._reward_script_hash) if multi_asset else None
+        return tokens.get(self._reward_token_name, 0) if tokens else 0
+
     def _get_reward_account_amount(self, reward_utxo: UTxO) -> int:
         """Get the amount of rewards in the reward account (tokens or ADA)."""
-        if (
-            self.token_config.reward_token_policy
-            and self.token_config.reward_token_name
-        ):
-            # Get token amount
-            script_hash = ScriptHash(
-                bytes.fromhex(self.token_config.reward_token_policy)
-            )
-            token_name = AssetName(bytes.fromhex(self.token_config.reward_token_name))
-
-            if (
-                reward_utxo.output.amount.multi_asset
-                and script_hash in reward_utxo.output.amount.multi_asset
-                and token_name in reward_utxo.output.amount.multi_asset[script_hash]
-            ):
-                return reward_utxo.output.amount.multi_asset[script_hash][token_name]
-            return 0
-        else:
-            # Return ADA amount
-            return reward_utxo.output.amount.coin
+        return self._utxo_reward(reward_utxo)
 
     def _calculate_balance(self, utxos: list[UTxO]) -> int:
         """Calculate the balance of an address (either tokens or ADA)."""
-        if (
-            self.token_config.reward_token_policy
-            and self.token_config.reward_token_name
-        ):
-            # Calculate token balance
-            script_hash = ScriptHash(
-                bytes.fromhex(self.token_config.reward_token_policy)
-            )
-            token_name = AssetName(bytes.fromhex(self.token_config.reward_token_name))
-
-            total = 0
-            for utxo in utxos:
-                if (
-                    utxo.output.amount.multi_asset
-                    and script_hash in utxo.output.amount.multi_asset
-                    and token_name in utxo.output.amount.multi_asset[script_hash]
-                ):
-                    total += utxo.output.amount.multi_asset[script_hash][token_name]
-
-            return total
-        else:
-            # Calculate ADA balance
-            return sum(utxo.output.amount.coin for utxo in utxos)
+        return sum(self._utxo_reward(utxo) for utxo in utxos)
 
     @async_retry(tries=TEST_RETRIES, delay=5)
     async def verify_platform_reward_collection(
@@ -235,13 +227,16 @@ class TestPlatformCollect(TestBase):
         """Verify that platform rewards were correctly collected."""
         logger.info("Verifying platform reward collection")
 
-        # Get UTxOs at script address
-        utxos = await self.chain_query.get_utxos(self.oracle_script_address)
+        # Get UTxOs at script and platform addresses concurrently
+        utxos, new_platform_utxos = await asyncio.gather(
+            self.chain_query.get_utxos(self.oracle_script_address),
+            self.chain_query.get_utxos(self.platform_address),
+        )
 
         # Check reward account
         new_reward_datum, reward_utxo = state_checks.get_reward_account_by_policy_id(
             utxos,
-            ScriptHash(bytes.fromhex(self.token_config.oracle_policy)),
+            self._oracle_script_hash,
         )
 
         assert new_reward_datum is not None, "Reward account datum not found"
@@ -253,10 +248,7 @@ class TestPlatformCollect(TestBase):
         expected_reward_after = original_reward_amount - expected_platform_rewards
 
         # We need some tolerance for ADA rewards due to transaction fees
-        if not (
-            self.token_config.reward_token_policy
-            and self.token_config.reward_token_name
-        ):
+        if self._reward_script_hash is None:
             assert (
                 new_reward_amount < original_reward_amount
             ), f"Reward account amount should decrease, but got {original_reward_amount} -> {new_reward_amount}"
@@ -270,26 +262,25 @@ class TestPlatformCollect(TestBase):
         new_rewards = new_reward_datum.nodes_to_rewards
         orig_rewards = original_reward_datum.nodes_to_rewards
 
-        assert len(new_rewards) == len(
-            orig_rewards
-        ), "Reward lists should have same length"
-
-        # Compare dictionaries directly (checks keys and values)
-        assert (
-            new_rewards == orig_rewards
-        ), "Node rewards should not change during platform collect"
+        # Compare dictionaries directly (checks keys, values and size); only
+        # build the per-node diff when they differ
+        if new_rewards != orig_rewards:
+            mismatches = {
+                node: (orig_rewards.get(node), new_rewards.get(node))
+                for node in orig_rewards.keys() | new_rewards.keys()
+                if orig_rewards.get(node) != new_rewards.get(node)
+            }
+            raise AssertionError(
+                f"Node rewards should not change during platform collect: {mismatches}"
+            )
 
         # 3. Verify the platform address received the rewards
-        new_platform_utxos = await self.chain_query.get_utxos(self.platform_address)
         new_platform_balance = self._calculate_balance(new_platform_utxos)
         logger.info(f"New platform balance: {new_platform_balance}")
 
         # The platform balance should increase
         # For tokens, we expect exact increase; for ADA, we account for transaction fees
-        if not (
-            self.token_config.reward_token_policy
-            and self.token_config.reward_token_name
-        ):
+        if self._reward_script_hash is None:
             # For ADA, just check that balance increased
             assert (
                 new_platform_balance > initial_platform_balance
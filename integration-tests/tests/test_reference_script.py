@@ -3,12 +3,13 @@
 from collections.abc import Callable
 
 import pytest
+from pycardano import UTxO
 
 from charli3_offchain_core.oracle.config import OracleScriptConfig
 
 from .async_utils import async_retry
-from .base import TEST_RETRIES, TestBase
-from .test_utils import logger, wait_for_indexing
+from .base import TEST_RETRIES, TRANSIENT_CHAIN_ERRORS, TestBase
+from .test_utils import logger, poll_until
 
 
 @pytest.mark.run(order=2)
@@ -27,11 +28,31 @@ class TestCreateReferenceScript(TestBase):
             reference_ada_amount=69528920,  # 69.52892 ADA for reference scripts
         )
 
-    @pytest.mark.asyncio
-    @async_retry(tries=TEST_RETRIES, delay=5)
     async def test_create_manager_reference_script(self) -> None:
         """Test creating the manager reference script."""
-        # Check if reference script already exists
+        # Only the build/submit/verify steps are retried
+        self._reference_submitted = False
+        manager_utxo = await self._create_manager_reference()
+        assert (
+            manager_utxo is not None
+        ), "Manager reference script not found after creation"
+
+        logger.info("Manager reference script created successfully")
+
+    @async_retry(
+        tries=TEST_RETRIES,
+        delay=0.5,
+        backoff=2,
+        max_delay=8,
+        exceptions=TRANSIENT_CHAIN_ERRORS,
+    )
+    async def _create_manager_reference(self) -> UTxO | None:
+        """Build, submit and wait for the manager reference script.
+
+        Skips when the script already existed before the test. On a retry, a
+        script indexed from an earlier attempt counts as success.
+        """
+        script_finder = self.orchestrator.reference_builder.script_finder
 
         # Prepare reference script transaction
         reference_result, needs_reference = (
@@ -43,7 +64,10 @@ class TestCreateReferenceScript(TestBase):
         )
 
         if not needs_reference:
-            pytest.skip("Manager reference script already exists")
+            if not self._reference_submitted:
+                pytest.skip("Manager reference script already exists")
+            logger.info("Manager reference script from an earlier attempt found")
+            return await script_finder.find_manager_reference()
 
         assert (
             reference_result.manager_tx is not None
@@ -51,19 +75,13 @@ class TestCreateReferenceScript(TestBase):
 
         logger.info("Manager reference script transaction built")
 
-        # Submit the transaction
+        # Submit the transaction; it may land even if this attempt then fails
+        self._reference_submitted = True
         await self.orchestrator.submit_reference_script_tx(
             reference_result, self.admin_signing_key
         )
 
         logger.info("Manager reference script transaction submitted")
 
-        # Verify that the reference script now exists
-        await wait_for_indexing(10)
-
-        manager_utxo = (
-            await self.orchestrator.reference_builder.script_finder.find_manager_reference()
-        )
-        assert (
-            manager_utxo is not None
-        ), "Manager reference script not found after creation"
+        # Verify that the reference script now exists, as soon as it is indexed
+        return await poll_until(script_finder.find_manager_reference)
@@ -5,16 +5,19 @@ from pathlib import Path
 
 import pytest
 from pycardano import (
-    PaymentExtendedSigningKey,
-    PaymentVerificationKey,
-    VerificationKeyHash,
+    UTxO,
 )
 
 from charli3_offchain_core.oracle.config import OracleScriptConfig
 
 from .async_utils import async_retry
-from .base import TEST_RETRIES, TestBase
-from .test_utils import logger, wait_for_indexing
+from .base import TEST_RETRIES, TRANSIENT_CHAIN_ERRORS, TestBase
+from .test_utils import (
+    load_platform_party_keys,
+    logger,
+    poll_until,
+    read_platform_parties,
+)
 
 
 class TestMultisigReferenceScript(TestBase):
@@ -55,39 +58,31 @@ class TestMultisigReferenceScript(TestBase):
             self.platform_keys = []
             return
 
+        # Read every administrator key hash once for both config and keys
+        platform_parties = read_platform_parties(self.platform_keys_dir)
+
         # Load platform configuration
         (self.required_signers, self.parties) = self.load_platform_config(
-            self.platform_keys_dir
+            self.platform_keys_dir, platform_parties
         )
         logger.info(f"Loaded {len(self.parties)} platform administrators from config")
         logger.info(f"Configured with {self.required_signers} required signers")
 
         # Load platform signing keys
-        self.platform_keys = []
-        for platform_dir in sorted(self.platform_keys_dir.glob("platform_*")):
-            try:
-                skey = PaymentExtendedSigningKey.load(
-                    str(platform_dir / "administrator.skey")
-                )
-                vkey = PaymentVerificationKey.load(
-                    str(platform_dir / "administrator.vkey")
-                )
-                vkh = VerificationKeyHash(
-                    bytes.fromhex(
-                        (platform_dir / "administrator.vkh").read_text().strip()
-                    )
-                )
-                self.platform_keys.append((skey, vkey, vkh))
-                logger.info(f"Loaded platform key: {vkh}")
-            except Exception as e:
-                logger.warning(f"Failed to load key from {platform_dir}: {e}")
-
-    def load_platform_config(self, platform_dir: Path) -> tuple[int, list[str]]:
+        self.platform_keys = load_platform_party_keys(platform_parties)
+
+    def load_platform_config(
+        self,
+        platform_dir: Path,
+        platform_parties: list[tuple[Path, str]] | None = None,
+    ) -> tuple[int, list[str]]:
         """
         Load platform multisig configuration from the specified directory.
 
         Args:
             platform_dir: Directory containing platform configuration files
+            platform_parties: Already read administrator key hashes, read from
+                ``platform_dir`` when not given
 
         Returns:
             Tuple containing:
@@ -105,18 +100,12 @@ class TestMultisigReferenceScript(TestBase):
             return (1, [])
 
         # Load all platform administrator configurations
-        parties = []
-        for admin_dir in sorted(platform_dir.glob("platform_*")):
-            try:
-                vkh = (admin_dir / "administrator.vkh").read_text().strip()
-                parties.append(vkh)
-            except FileNotFoundError:
-                logger.warning(f"Missing vkh file in {admin_dir}")
+        if platform_parties is None:
+            platform_parties = read_platform_parties(platform_dir)
+        parties = [vkh for _, vkh in platform_parties]
 
         return (required_sigs, parties)
 
-    @pytest.mark.asyncio
-    @async_retry(tries=TEST_RETRIES, delay=5)
     async def test_create_manager_reference_script(self) -> None:
         """Test creating the manager reference script with multisignature support."""
         logger.info("Starting manager reference script creation test")
@@ -134,6 +123,30 @@ class TestMultisigReferenceScript(TestBase):
         else:
             logger.info("Multisig not configured, using standard signing")
 
+        # Only the build/submit/verify steps are retried
+        self._reference_submitted = False
+        manager_utxo = await self._create_manager_reference()
+        assert (
+            manager_utxo is not None
+        ), "Manager reference script not found after creation"
+
+        logger.info("Manager reference script created successfully")
+
+    @async_retry(
+        tries=TEST_RETRIES,
+        delay=0.5,
+        backoff=2,
+        max_delay=8,
+        exceptions=TRANSIENT_CHAIN_ERRORS,
+    )
+    async def _create_manager_reference(self) -> UTxO | None:
+        """Build, submit and wait for the manager reference script.
+
+        Skips when the script already existed before the test. On a retry, a
+        script indexed from an earlier attempt counts as success.
+        """
+        script_finder = self.orchestrator.reference_builder.script_finder
+
         # Prepare reference script transaction
         reference_result, needs_reference = (
             await self.orchestrator.handle_reference_scripts(
@@ -144,7 +157,10 @@ class TestMultisigReferenceScript(TestBase):
         )
 
         if not needs_reference:
-            pytest.skip("Manager reference script already exists")
+            if not self._reference_submitted:
+                pytest.skip("Manager reference script already exists")
+            logger.info("Manager reference script from an earlier attempt found")
+            return await script_finder.find_manager_reference()
 
         assert (
             reference_result.manager_tx is not None
@@ -154,20 +170,13 @@ class TestMultisigReferenceScript(TestBase):
             f"Manager reference script transaction built: {reference_result.manager_tx.id}"
         )
 
-        # Submit the transaction
+        # Submit the transaction; it may land even if this attempt then fails
+        self._reference_submitted = True
         await self.orchestrator.submit_reference_script_tx(
             reference_result, self.admin_signing_key
         )
 
         logger.info("Manager reference script transaction submitted")
 
-        # Verify that the reference script now exists
-        await wait_for_indexing(10)
-        manager_utxo = (
-            await self.orchestrator.reference_builder.script_finder.find_manager_reference()
-        )
-        assert (
-            manager_utxo is not None
-        ), "Manager reference script not found after creation"
-
-        logger.info("Manager reference script created successfully")
+        # Verify that the reference script now exists, as soon as it is indexed
+        return await poll_until(script_finder.find_manager_reference)
@@ -1,6 +1,5 @@
 """Test the creation of the TestC3 reward tokens."""
 
-import asyncio
 from typing import Any
 
 import pytest
@@ -10,12 +9,12 @@ from pycardano import (
     MultiAsset,
     TransactionBuilder,
     TransactionOutput,
+    UTxO,
     Value,
     VerificationKeyHash,
 )
 
 from charli3_offchain_core.cli.config.formatting import format_status_update
-from charli3_offchain_core.cli.setup import setup_platform_from_config
 from charli3_offchain_core.platform.auth.token_script_builder import (
     PlatformAuthScript,
     ScriptConfig,
@@ -25,6 +24,7 @@ from .async_utils import async_retry
 from .base import TestBase
 from .test_utils import (
     logger,
+    poll_until,
     update_config_file,
 )
 
@@ -40,8 +40,8 @@ class TestRewardToken(TestBase):
 
         # Use the CLI setup function for platform auth
         try:
-            # We'll use the same config file but focus on platform auth settings
-            platform_setup = setup_platform_from_config(self.config_path, None)
+            # Shared across tests while the config file is unchanged
+            platform_setup = self.load_platform_setup()
 
             # Unpack the result tuple
             (
@@ -69,7 +69,6 @@ class TestRewardToken(TestBase):
             logger.error(f"Error setting up Reward Token test environment: {e}")
             raise
 
-    @pytest.mark.asyncio
     @async_retry(tries=1, delay=0)
     async def test_mint_reward_tokens(self) -> None:
         """Test minting TestC3 reward tokens."""
@@ -98,9 +97,10 @@ class TestRewardToken(TestBase):
         # 1. Create token minting policy
         validity_slot, minting_script = script_builder.build_minting_script()
         script_hash = minting_script.hash()
-        policy_id = script_hash.payload
+        policy_hex = script_hash.payload.hex()
+        token_name = self.token_name
 
-        logger.info(f"Created minting policy with ID: {policy_id.hex()}")
+        logger.info(f"Created minting policy with ID: {policy_hex}")
 
         # 2. Create transaction builder
         builder = TransactionBuilder(
@@ -119,7 +119,7 @@ class TestRewardToken(TestBase):
         builder.add_minting_script(minting_script)
 
         # 5. Create output with tokens
-        output_value = Value(2_000_000) + Value(0, token_value)  # 2 ADA + all tokens
+        output_value = Value(2_000_000, token_value)  # 2 ADA + all tokens
         builder.add_output(
             TransactionOutput(address=self.admin_address, amount=output_value)
         )
@@ -136,47 +136,41 @@ class TestRewardToken(TestBase):
 
         logger.info(f"Submitting token minting transaction: {tx.id}")
         status, _ = await self.platform_tx_manager.sign_and_submit(
-            tx, [self.admin_signing_key], wait_confirmation=True
+            tx, [self.admin_signing_key], wait_confirmation=False
         )
 
-        # 9. Verify transaction status
-        assert status == "confirmed", f"Token minting transaction failed: {status}"
-        logger.info(f"Token minting transaction confirmed: {tx.id}")
+        # 9. Verify the transaction was accepted
+        assert status == "submitted", f"Token minting transaction failed: {status}"
+        logger.info(f"Token minting transaction submitted: {tx.id}")
 
-        # 10. Wait for indexing
-        await asyncio.sleep(10)
+        # 10. Wait until the minted tokens are indexed at the admin address;
+        # this also proves the transaction was confirmed
+        async def find_token_utxo() -> UTxO | None:
+            token_utxos = await self.chain_query.get_utxos_by_asset(
+                self.admin_address, script_hash, token_name
+            )
+            return token_utxos[0] if token_utxos else None
 
         # 11. Verify tokens were minted
-        utxos = await self.chain_query.get_utxos(self.admin_address)
-        token_utxo = None
-        for utxo in utxos:
-            if (
-                utxo.output.amount.multi_asset
-                and script_hash in utxo.output.amount.multi_asset
-                and self.token_name in utxo.output.amount.multi_asset[script_hash]
-            ):
-                token_utxo = utxo
-                break
+        token_utxo = await poll_until(
+            find_token_utxo, timeout=self.platform_chain_query.confirmation_timeout
+        )
 
         assert token_utxo is not None, "TestC3 tokens not found after minting"
-        token_amount = token_utxo.output.amount.multi_asset[script_hash][
-            self.token_name
-        ]
+        token_amount = token_utxo.output.amount.multi_asset[script_hash][token_name]
         logger.info(f"Found TestC3 tokens: {token_amount}")
         assert (
             token_amount == self.token_amount
         ), f"Token amount mismatch: {token_amount} vs {self.token_amount}"
 
         # 12. Update configuration with reward token policy and name
-        logger.info(
-            f"Updating configuration with reward token policy: {policy_id.hex()}"
-        )
+        logger.info(f"Updating configuration with reward token policy: {policy_hex}")
 
         update_config_file(
             self.config_path,
             {
-                "tokens.fee_token_policy": policy_id.hex(),
-                "tokens.fee_token_name": self.token_name.to_primitive().hex(),
+                "tokens.fee_token_policy": policy_hex,
+                "tokens.fee_token_name": token_name.to_primitive().hex(),
             },
         )
 
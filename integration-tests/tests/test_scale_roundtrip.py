@@ -0,0 +1,54 @@
+"""Test module for scaling Oracle Data Verification UTxOs up and back down.
+
+This module runs the scale-up and scale-down operations back-to-back in a single
+test, so both share one environment setup. The UTxOs added by the scale-up are
+empty, which makes them eligible for the scale-down that follows. The amounts
+are taken from the standalone TestScaleUp and TestScaleDown, so the oracle ends
+in the same state as when those two run on their own.
+"""
+
+from collections.abc import Callable
+
+# Import the modules rather than the classes so pytest does not collect the
+# standalone scale tests a second time from this module
+from . import test_scale_down, test_scale_up
+from .governance import GovernanceBase
+from .test_utils import logger
+
+
+class TestScaleRoundtrip(GovernanceBase):
+    """Test class for scaling Oracle UTxOs up and then back down in one test."""
+
+    def setup_method(self, method: Callable) -> None:
+        """Set up the test environment before each test method execution.
+
+        Args:
+            method (Callable): The test method being run.
+        """
+        logger.info("Setting up TestScaleRoundtrip environment")
+        super().setup_method(method)
+        logger.info("TestScaleRoundtrip setup completed")
+
+    async def test_scale_roundtrip(self) -> None:
+        """Test scaling Oracle RewardAccount and AggState UTxOs up and back down.
+
+        This test method:
+        1. Scales up, polling until the new UTxOs are indexed
+        2. Scales down, polling until the UTxOs are removed
+
+        The platform auth NFT is spent and recreated by the scale-up, so the
+        scale-down resolves it again from its own batched query.
+
+        Raises:
+            AssertionError: If either transaction fails to build or submit, or if
+                the UTxO counts do not change as expected
+        """
+        scale_up = test_scale_up.TestScaleUp
+        scale_down = test_scale_down.TestScaleDown
+
+        await self.run_scale(
+            "up", scale_up.REWARD_ACCOUNTS_TO_ADD, scale_up.AGGSTATES_TO_ADD
+        )
+        await self.run_scale(
+            "down", scale_down.REWARD_ACCOUNTS_TO_REMOVE, scale_down.AGGSTATES_TO_REMOVE
+        )
@@ -2,21 +2,52 @@
 
 import asyncio
 import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Awaitable, Callable
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import yaml
-from pycardano import Address, AssetName, UTxO
+from pycardano import (
+    Address,
+    AssetName,
+    PaymentExtendedSigningKey,
+    PaymentVerificationKey,
+    ScriptHash,
+    Transaction,
+    TransactionId,
+    TransactionInput,
+    UTxO,
+    VerificationKeyHash,
+)
 
+from charli3_offchain_core.blockchain.chain_query import ChainQuery
 from charli3_offchain_core.platform.auth.token_finder import PlatformAuthFinder
 
+try:
+    # Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
 # Configure shared logger for all test modules
 logger = logging.getLogger("odv_tests")
 
+T = TypeVar("T")
+K = TypeVar("K")
+
 
 def update_config_file(config_path: Path, updates: dict[str, Any]) -> None:
     """Update configuration YAML file with new values.
 
+    All updates are applied to a single read of the file and written back in one
+    atomic replace. The write is skipped when no value actually changes.
+
     Args:
         config_path: Path to the configuration file
         updates: Dictionary of updates in the format {section.key: value}
@@ -24,26 +55,47 @@ def update_config_file(config_path: Path, updates: dict[str, Any]) -> None:
     """
     try:
         # Load existing configuration
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f)
+        with open(config_path, encoding="utf-8") as f:
+            config_data = yaml.load(f, Loader=YamlLoader)
 
         # Apply updates
+        changed = False
         for key_path, value in updates.items():
-            parts = key_path.split(".")
+            *sections, key = key_path.split(".")
 
-            # Navigate to the nested dictionary
-            current = config_data
-            for part in parts[:-1]:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
+            # Navigate to the nested dictionary, creating missing sections
+            current = reduce(
+                lambda section, part: section.setdefault(part, {}),
+                sections,
+                config_data,
+            )
 
             # Set the value
-            current[parts[-1]] = value
+            if key not in current or current[key] != value:
+                current[key] = value
+                changed = True
 
-        # Write updated configuration back to file
-        with open(config_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False)
+        if not changed:
+            logger.info(f"Configuration file already up to date: {config_path}")
+            return
+
+        # Write to a sibling temp file and swap it in so readers never see a
+        # partially written configuration
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=config_path.parent,
+            prefix=f".{config_path.name}.",
+            delete=False,
+        ) as f:
+            try:
+                yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False)
+            except Exception:
+                f.close()
+                os.unlink(f.name)
+                raise
+        shutil.copymode(config_path, f.name)
+        os.replace(f.name, config_path)
 
         logger.info(f"Configuration file updated: {config_path}")
 
@@ -67,32 +119,205 @@ async def find_platform_auth_nft(
     Returns:
         UTxO containing the auth NFT if found, None otherwise
     """
-    for address in addresses:
-        logger.info(f"Looking for platform auth NFT at address: {address}")
-        platform_utxo = await auth_finder.find_auth_utxo(
-            policy_id=policy_id,
-            platform_address=str(address),
-        )
+    # The auth NFT is unique, so the first address to report it wins and the
+    # remaining lookups are cancelled. A failed lookup only rules out its own
+    # address, so it cannot hide the NFT found at another one.
+    address_strs = [str(address) for address in addresses]
+    logger.info(f"Looking for platform auth NFT at addresses: {address_strs}")
 
-        if platform_utxo:
-            logger.info(
-                f"Found platform auth NFT in UTxO: "
-                f"{platform_utxo.input.transaction_id}#{platform_utxo.input.index}"
+    async def lookup(address: str) -> tuple[str, UTxO | None]:
+        try:
+            return address, await auth_finder.find_auth_utxo(
+                policy_id=policy_id, platform_address=address
             )
-            return platform_utxo
+        except Exception as e:
+            logger.warning(f"Failed to look up platform auth NFT at {address}: {e}")
+            return address, None
+
+    tasks = [asyncio.create_task(lookup(address)) for address in address_strs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            address, platform_utxo = await next_done
+            if platform_utxo:
+                logger.info(
+                    f"Found platform auth NFT at {address} in UTxO: "
+                    f"{platform_utxo.input.transaction_id}#{platform_utxo.input.index}"
+                )
+                return platform_utxo
+    finally:
+        for task in tasks:
+            task.cancel()
 
     logger.warning("Platform auth NFT not found at any of the provided addresses")
     return None
 
 
-async def wait_for_indexing(seconds: int = 5) -> None:
+def find_minted_utxo(transaction: Transaction, policy_id: str) -> UTxO | None:
+    """Build the UTxO reference of a transaction output holding a policy token.
+
+    Args:
+        transaction: Submitted transaction
+        policy_id: Policy ID to search for
+
+    Returns:
+        UTxO created by the transaction holding the token, None if no output has it
+    """
+    policy_hash = ScriptHash(bytes.fromhex(policy_id))
+    for index, output in enumerate(transaction.transaction_body.outputs):
+        if output.amount.multi_asset and policy_hash in output.amount.multi_asset:
+            return UTxO(TransactionInput(transaction.id, index), output)
+    return None
+
+
+@lru_cache(maxsize=64)
+def _load_key_file(key_type: type, path: str, mtime_ns: int) -> Any:
+    """Deserialize a key file once per path and modification time."""
+    return key_type.load(path)
+
+
+def load_key_cached(key_type: type[K], path: Path) -> K:
+    """Load a pycardano key file, reusing the parsed key while it is unchanged.
+
+    Args:
+        key_type: Key class providing ``load``, e.g. PaymentExtendedSigningKey
+        path: Path of the key file
+
+    Returns:
+        The deserialized key
+    """
+    return _load_key_file(key_type, str(path), path.stat().st_mtime_ns)
+
+
+def read_platform_parties(platform_dir: Path) -> list[tuple[Path, str]]:
+    """List platform administrator directories with their key hash.
+
+    Directories without a readable ``administrator.vkh`` are skipped.
+
+    Args:
+        platform_dir: Directory containing the platform_* key directories
+
+    Returns:
+        (administrator directory, key hash hex) pairs sorted by directory name
+    """
+    with os.scandir(platform_dir) as entries:
+        admin_dirs = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith("platform_") and entry.is_dir()
+        )
+
+    parties = []
+    for admin_dir in admin_dirs:
+        try:
+            vkh_hex = (admin_dir / "administrator.vkh").read_text().strip()
+        except FileNotFoundError:
+            logger.warning(f"Missing vkh file in {admin_dir}")
+            continue
+        parties.append((admin_dir, vkh_hex))
+    return parties
+
+
+def load_platform_party_keys(
+    parties: list[tuple[Path, str]],
+) -> list[
+    tuple[PaymentExtendedSigningKey, PaymentVerificationKey, VerificationKeyHash]
+]:
+    """Load the signing keys of platform administrators.
+
+    Administrators whose keys cannot be read are skipped with a warning.
+
+    Args:
+        parties: (administrator directory, key hash hex) pairs from
+            read_platform_parties
+
+    Returns:
+        (signing key, verification key, key hash) of each loaded administrator
+    """
+    platform_keys = []
+    for admin_dir, vkh_hex in parties:
+        try:
+            skey = load_key_cached(
+                PaymentExtendedSigningKey, admin_dir / "administrator.skey"
+            )
+            vkey = load_key_cached(
+                PaymentVerificationKey, admin_dir / "administrator.vkey"
+            )
+            vkh = VerificationKeyHash(bytes.fromhex(vkh_hex))
+        except Exception as e:
+            logger.warning(f"Failed to load key from {admin_dir}: {e}")
+            continue
+        logger.info(f"Loaded platform key: {vkh}")
+        platform_keys.append((skey, vkey, vkh))
+    return platform_keys
+
+
+async def wait_for_indexing(
+    seconds: float = 5,
+    *,
+    chain_query: ChainQuery | None = None,
+    address: str | Address | None = None,
+    tx_id: TransactionId | None = None,
+) -> None:
     """Wait for blockchain indexers to process recent transactions.
 
+    Without a chain query this is a fixed sleep. Given a chain query, an
+    address and a transaction id it returns as soon as one of the
+    transaction's outputs is visible at the address, using ``seconds`` as
+    the upper bound.
+
+    Args:
+        seconds: Number of seconds to wait, or the timeout when polling
+        chain_query: Chain query used to poll the address
+        address: Address receiving an output of the transaction
+        tx_id: Transaction whose outputs should be indexed
+    """
+    if chain_query is None or address is None or tx_id is None:
+        logger.info(f"Waiting {seconds} seconds for UTxOs to be indexed...")
+        await asyncio.sleep(seconds)
+        return
+
+    logger.info(f"Waiting up to {seconds} seconds for {tx_id} to be indexed...")
+
+    async def outputs_indexed() -> bool:
+        utxos = await chain_query.get_utxos(address)
+        return any(utxo.input.transaction_id == tx_id for utxo in utxos)
+
+    if not await poll_until(outputs_indexed, timeout=seconds):
+        logger.warning(f"Outputs of {tx_id} not indexed after {seconds} seconds")
+
+
+async def poll_until(
+    coro_factory: Callable[[], Awaitable[T]],
+    timeout: float = 30,
+    initial: float = 0.5,
+    max_delay: float = 4.0,
+    predicate: Callable[[T], bool] = bool,
+) -> T:
+    """Poll an async check until its result satisfies ``predicate`` or the timeout expires.
+
+    The delay between attempts starts at ``initial`` and grows by half on every
+    miss, capped at ``max_delay``.
+
     Args:
-        seconds: Number of seconds to wait
+        coro_factory: Callable returning a fresh awaitable for each attempt
+        timeout: Maximum number of seconds to keep polling
+        initial: Seconds to wait after the first miss
+        max_delay: Upper bound for the wait between attempts
+        predicate: Check applied to each result, truthiness by default
+
+    Returns:
+        The first accepted result, or the last result once the timeout expires
     """
-    logger.info(f"Waiting {seconds} seconds for UTxOs to be indexed...")
-    await asyncio.sleep(seconds)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = initial
+    while True:
+        result = await coro_factory()
+        remaining = deadline - loop.time()
+        if predicate(result) or remaining <= 0:
+            return result
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, max_delay)
 
 
 def find_oracle_policy_hash(utxos: list[UTxO], token_name: str) -> str:
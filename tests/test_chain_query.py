@@ -0,0 +1,151 @@
+"""Tests for transaction confirmation polling in ChainQuery."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from charli3_offchain_core.blockchain import chain_query as chain_query_module
+from charli3_offchain_core.blockchain.chain_query import ChainQuery, ChainQueryConfig
+from charli3_offchain_core.blockchain.network import NetworkConfig, NetworkType
+
+TX_ID = "aa" * 32
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the code under test sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the clock and sleep used by the confirmation loop."""
+    fake = FakeClock()
+    monkeypatch.setattr(chain_query_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(chain_query_module.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def make_chain_query(
+    slot_length: float = 1.0, active_slots_coefficient: float = 0.05, **config: int
+) -> ChainQuery:
+    """Build a ChainQuery over a mocked chain context."""
+    context = MagicMock()
+    context.genesis_param.slot_length = slot_length
+    context.genesis_param.active_slots_coefficient = active_slots_coefficient
+    return ChainQuery(
+        kupo_ogmios_context=context,
+        config=ChainQueryConfig(
+            network_config=NetworkConfig.from_network(NetworkType.PREPROD), **config
+        ),
+    )
+
+
+def confirm_after(chain_query: ChainQuery, checks: int) -> MagicMock:
+    """Make the transaction appear on chain at the given confirmation check."""
+    confirmed_tx = MagicMock()
+    check = MagicMock(side_effect=[None] * (checks - 1) + [confirmed_tx])
+    chain_query._check_tx_confirmation = check
+    return confirmed_tx
+
+
+class TestChainQueryTiming:
+    """Test the block time and timeout derived from the configuration."""
+
+    def test_confirmation_timeout(self) -> None:
+        """The default timeout is the max_retries * retry_delay budget."""
+        chain_query = make_chain_query(max_retries=4, retry_delay=15)
+        assert chain_query.confirmation_timeout == 60.0
+
+    def test_expected_block_time_from_genesis(self) -> None:
+        """Block time is slot length over the active slot coefficient."""
+        chain_query = make_chain_query(slot_length=1.0, active_slots_coefficient=0.05)
+        assert chain_query.expected_block_time == pytest.approx(20.0)
+
+    def test_expected_block_time_falls_back_to_retry_delay(self) -> None:
+        """Without genesis parameters, block time falls back to retry_delay."""
+        chain_query = make_chain_query(retry_delay=7)
+        type(chain_query.context).genesis_param = property(
+            MagicMock(side_effect=RuntimeError("backend unavailable"))
+        )
+        assert chain_query.expected_block_time == 7.0
+        # The fallback is not cached, so genesis is read again on the next call
+        assert chain_query._expected_block_time is None
+
+
+class TestWaitForConfirmation:
+    """Test the confirmation polling loop."""
+
+    @pytest.mark.asyncio
+    async def test_confirmed_on_first_check(self, clock: FakeClock) -> None:
+        """A transaction already on chain is returned without sleeping."""
+        chain_query = make_chain_query()
+        confirmed_tx = confirm_after(chain_query, checks=1)
+
+        assert await chain_query._wait_for_confirmation(TX_ID) == (
+            "confirmed",
+            confirmed_tx,
+        )
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_up_to_a_third_of_block_time(
+        self, clock: FakeClock
+    ) -> None:
+        """The delay doubles from initial_retry_delay and is capped by block time."""
+        # 20s blocks cap the delay at 20 / 3 seconds, below retry_delay
+        chain_query = make_chain_query(retry_delay=20, max_retries=10)
+        confirm_after(chain_query, checks=7)
+
+        status, _ = await chain_query._wait_for_confirmation(TX_ID)
+
+        assert status == "confirmed"
+        assert clock.sleeps == pytest.approx([0.5, 1.0, 2.0, 4.0, 20 / 3, 20 / 3])
+
+    @pytest.mark.asyncio
+    async def test_backoff_capped_by_retry_delay(self, clock: FakeClock) -> None:
+        """The delay never exceeds retry_delay, even with slow blocks."""
+        chain_query = make_chain_query(
+            slot_length=1.0, active_slots_coefficient=0.01, retry_delay=3
+        )
+        confirm_after(chain_query, checks=5)
+
+        await chain_query._wait_for_confirmation(TX_ID)
+
+        assert clock.sleeps == pytest.approx([0.5, 1.0, 2.0, 3.0])
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, clock: FakeClock) -> None:
+        """Polling stops at the deadline and reports a timeout."""
+        chain_query = make_chain_query()
+        chain_query._check_tx_confirmation = MagicMock(return_value=None)
+
+        assert await chain_query._wait_for_confirmation(TX_ID, timeout=10) == (
+            "timeout",
+            None,
+        )
+        # The last sleep is shortened so the final check lands on the deadline
+        assert clock.sleeps == pytest.approx([0.5, 1.0, 2.0, 4.0, 2.5])
+        assert clock.now == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_default_timeout_is_confirmation_timeout(
+        self, clock: FakeClock
+    ) -> None:
+        """Without an explicit timeout the confirmation_timeout budget applies."""
+        chain_query = make_chain_query(max_retries=2, retry_delay=5)
+        chain_query._check_tx_confirmation = MagicMock(return_value=None)
+
+        status, _ = await chain_query._wait_for_confirmation(TX_ID)
+
+        assert status == "timeout"
+        assert clock.now == pytest.approx(chain_query.confirmation_timeout)
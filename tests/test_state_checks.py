@@ -0,0 +1,138 @@
+"""Tests for the single pass oracle script UTxO scan."""
+
+import pytest
+from pycardano import (
+    Address,
+    Datum,
+    IndefiniteList,
+    MultiAsset,
+    ScriptHash,
+    TransactionId,
+    TransactionInput,
+    TransactionOutput,
+    UTxO,
+    Value,
+    VerificationKeyHash,
+)
+from pycardano.serialization import RawCBOR
+
+from charli3_offchain_core.models.oracle_datums import (
+    FeeConfig,
+    NoDatum,
+    Nodes,
+    OracleSettingsDatum,
+    OracleSettingsVariant,
+    RewardPrices,
+)
+from charli3_offchain_core.oracle.exceptions import StateValidationError
+from charli3_offchain_core.oracle.utils.state_checks import scan_script_utxos
+
+POLICY_ID = ScriptHash(bytes.fromhex("11" * 28))
+OTHER_POLICY_ID = ScriptHash(bytes.fromhex("22" * 28))
+SCRIPT_ADDRESS = Address(payment_part=POLICY_ID)
+
+
+def make_settings_datum() -> OracleSettingsDatum:
+    """Build a valid oracle settings datum with a single node."""
+    return OracleSettingsDatum(
+        nodes=Nodes(node_map=IndefiniteList([VerificationKeyHash(bytes(28))])),
+        required_node_signatures_count=1,
+        fee_info=FeeConfig(
+            rate_nft=NoDatum(),
+            reward_prices=RewardPrices(node_fee=1_000, platform_fee=500),
+        ),
+        aggregation_liveness_period=300_000,
+        time_uncertainty_aggregation=60_000,
+        time_uncertainty_platform=120_000,
+        iqr_fence_multiplier=150,
+        median_divergency_factor=1,
+        utxo_size_safety_buffer=1_000_000,
+        pause_period_started_at=NoDatum(),
+    )
+
+
+def make_utxo(
+    index: int,
+    token_name: str | None = None,
+    policy_id: ScriptHash = POLICY_ID,
+    datum: Datum | None = None,
+) -> UTxO:
+    """Build a script UTxO holding one token of the given name, if any."""
+    amount = Value(2_000_000)
+    if token_name:
+        amount.multi_asset = MultiAsset.from_primitive(
+            {policy_id.payload: {token_name.encode(): 1}}
+        )
+    return UTxO(
+        TransactionInput(TransactionId(bytes(32)), index),
+        TransactionOutput(SCRIPT_ADDRESS, amount, datum=datum),
+    )
+
+
+def raw_settings_datum(datum: OracleSettingsDatum) -> RawCBOR:
+    """Encode a settings datum as it arrives from the chain backend."""
+    return RawCBOR(OracleSettingsVariant(datum=datum).to_cbor())
+
+
+class TestScanScriptUtxos:
+    """Test scan_script_utxos."""
+
+    def test_finds_settings_and_token_utxos(self) -> None:
+        """Settings and token UTxOs are found in one scan and the datum decoded."""
+        settings = make_settings_datum()
+        settings_utxo = make_utxo(0, "C3CS", datum=raw_settings_datum(settings))
+        accounts = [make_utxo(1, "C3RA"), make_utxo(2, "C3RA")]
+        utxos = [make_utxo(3), make_utxo(4, "C3AS"), settings_utxo, *accounts]
+
+        datum, found_utxo, matching = scan_script_utxos(
+            utxos, POLICY_ID, "C3CS", "C3RA"
+        )
+
+        assert datum == settings
+        assert found_utxo is settings_utxo
+        assert matching == accounts
+
+    def test_settings_token_name_is_configurable(self) -> None:
+        """The settings UTxO is found by the given settings token name."""
+        settings = make_settings_datum()
+        settings_utxo = make_utxo(0, "SETTINGS", datum=raw_settings_datum(settings))
+        utxos = [make_utxo(1, "C3CS"), settings_utxo]
+
+        datum, found_utxo, _ = scan_script_utxos(utxos, POLICY_ID, "SETTINGS")
+
+        assert datum == settings
+        assert found_utxo is settings_utxo
+
+    def test_no_token_name_collects_nothing(self) -> None:
+        """Without a token name only the settings are looked up."""
+        settings_utxo = make_utxo(
+            0, "C3CS", datum=OracleSettingsVariant(datum=make_settings_datum())
+        )
+
+        datum, found_utxo, matching = scan_script_utxos(
+            [settings_utxo, make_utxo(1, "C3RA")], POLICY_ID, "C3CS"
+        )
+
+        assert datum is not None
+        assert found_utxo is settings_utxo
+        assert matching == []
+
+    def test_ignores_tokens_of_other_policies(self) -> None:
+        """Tokens under another policy are neither settings nor matches."""
+        utxos = [
+            make_utxo(0, "C3CS", policy_id=OTHER_POLICY_ID),
+            make_utxo(1, "C3RA", policy_id=OTHER_POLICY_ID),
+        ]
+
+        assert scan_script_utxos(utxos, POLICY_ID, "C3CS", "C3RA") == (
+            None,
+            None,
+            [],
+        )
+
+    def test_invalid_settings_datum(self) -> None:
+        """A settings UTxO whose datum cannot be decoded is reported."""
+        utxos = [make_utxo(0, "C3CS", datum=RawCBOR(b"\x00"))]
+
+        with pytest.raises(StateValidationError):
+            scan_script_utxos(utxos, POLICY_ID, "C3CS")